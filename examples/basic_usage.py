@@ -23,12 +23,41 @@ app = marimo.App(
 
 with app.setup:
     """Setup"""
+    import os
+    import tempfile
+    from pathlib import Path
+
+    import bpy
     import marimo as mo
 
     from bpy_widget import BpyWidget
+    from bpy_widget.core.compositor_manager import get_compositor_chain
+    from bpy_widget.core.materials import MATERIAL_PRESETS
+
+    # Static dropdown options - computed once instead of on every cell re-run
+    PRESET_NAMES = tuple(MATERIAL_PRESETS)
 
     widget = BpyWidget(width=1920, height=1080)
 
+    # Last values pushed to Blender - cells only re-apply what actually changed
+    applied_settings = {}
+
+    # Build the post-processing chain once; the effects cell only toggles node mute
+    widget.setup_extended_compositor()
+    widget.add_bloom_glare(intensity=0.5, threshold=0.8)
+    widget.add_vignette(amount=0.15)
+    widget.add_color_correction(saturation=1.1)
+    _chain = get_compositor_chain()
+    # Effect nodes by the names the add_* helpers register them under
+    effect_nodes = {
+        "bloom": [_chain.get_effect("Bloom_Glare")],
+        "vignette": [_chain.get_effect("Vignette")],
+        "color_correction": [
+            _chain.get_effect(_node_name)
+            for _node_name in ("ColorCorrection_BrightContrast", "ColorCorrection_HueSat", "ColorCorrection")
+        ],
+    }
+
 
 @app.cell
 def viewport():
@@ -41,10 +70,8 @@ def viewport():
 @app.cell
 def materials():
     """Materials"""
-    from bpy_widget.core.materials import MATERIAL_PRESETS
-
     preset_dropdown = mo.ui.dropdown(
-        options=list(MATERIAL_PRESETS.keys()),
+        options=PRESET_NAMES,
         value="gold",
         label="Material Preset"
     )
@@ -61,14 +88,17 @@ def apply_material(preset_dropdown):
     """Apply Material - automatically when preset changes"""
     suzanne_obj = widget.objects.get("Suzanne")
     if suzanne_obj:
-        # Create material with unique name to avoid conflicts
+        # One material per preset - reuse it instead of rebuilding the node tree
         material_name = f"Suzanne_{preset_dropdown.value}"
-        material = widget.create_preset_material(
-            material_name,
-            preset_dropdown.value
-        )
-        widget.assign_material(suzanne_obj, material)
-        widget.render()
+        material = widget.data.materials.get(material_name)
+        if material is None:
+            material = widget.create_preset_material(
+                material_name,
+                preset_dropdown.value
+            )
+        if suzanne_obj.active_material != material:
+            widget.assign_material(suzanne_obj, material)
+            widget.render_async(if_visible=True)
     return
 
 
@@ -91,30 +121,38 @@ def post_processing():
 @app.cell
 def setup_effects(bloom_enabled, color_correction_enabled, vignette_enabled):
     """Setup Effects - automatically when checkboxes change"""
-    widget.setup_extended_compositor()
-
-    if bloom_enabled.value:
-        widget.add_bloom_glare(intensity=0.5, threshold=0.8)
-    if vignette_enabled.value:
-        widget.add_vignette(amount=0.15)
-    if color_correction_enabled.value:
-        widget.add_color_correction(saturation=1.1)
-
-    widget.render()
+    _effects = (bloom_enabled.value, vignette_enabled.value, color_correction_enabled.value)
+    if applied_settings.get("effects") != _effects:
+        applied_settings["effects"] = _effects
+
+        # Muted nodes pass their input through - no nodes are added or relinked
+        for _name, _enabled in (
+            ("bloom", bloom_enabled.value),
+            ("vignette", vignette_enabled.value),
+            ("color_correction", color_correction_enabled.value),
+        ):
+            for _node in effect_nodes[_name]:
+                if _node is not None:
+                    _node.mute = not _enabled
+
+        widget.render_async(if_visible=True)
     return
 
 
 @app.cell
 def scene_controls():
     """Scene Controls"""
+    # debounce=True: dragging emits a single value on release instead of one per tick
     sun_energy_slider = mo.ui.slider(
         start=0.5, stop=10.0, value=3.0, step=0.5,
-        label="Sun Energy"
+        label="Sun Energy",
+        debounce=True
     )
 
     background_strength_slider = mo.ui.slider(
         start=0.0, stop=2.0, value=1.0, step=0.1,
-        label="Background Strength"
+        label="Background Strength",
+        debounce=True
     )
 
     render_engine_dropdown = mo.ui.dropdown(
@@ -151,20 +189,34 @@ def update_scene(
     render_engine_dropdown,
     sun_energy_slider,
 ):
-    """Update Scene"""
-    widget.setup_lighting(sun_energy=sun_energy_slider.value)
-    widget.setup_world_background(
-        color=(0.05, 0.05, 0.1),
-        strength=background_strength_slider.value
-    )
-    widget.set_render_engine(render_engine_dropdown.value)
+    """Update Scene - only changed settings are applied, then one render"""
+    _dirty = False
+
+    if applied_settings.get("sun_energy") != sun_energy_slider.value:
+        widget.setup_lighting(sun_energy=sun_energy_slider.value)
+        applied_settings["sun_energy"] = sun_energy_slider.value
+        _dirty = True
+
+    if applied_settings.get("background_strength") != background_strength_slider.value:
+        widget.setup_world_background(
+            color=(0.05, 0.05, 0.1),
+            strength=background_strength_slider.value
+        )
+        applied_settings["background_strength"] = background_strength_slider.value
+        _dirty = True
+
+    if widget.render_engine != render_engine_dropdown.value:
+        widget.set_render_engine(render_engine_dropdown.value)
+        _dirty = True
 
     # Update GPU backend if changed
     current_backend = widget.get_gpu_backend()
     if current_backend != gpu_backend_dropdown.value:
         widget.set_gpu_backend(gpu_backend_dropdown.value)
+        _dirty = True
 
-    widget.render()
+    if _dirty:
+        widget.render_async(if_visible=True)
     return
 
 
@@ -186,21 +238,23 @@ def object_creation():
 @app.cell
 def handle_objects(clear_scene_btn, create_sphere_btn, create_torus_btn):
     """Handle Object Creation"""
+    # Several buttons may fire in one run - render once at the end
+    _needs_render = False
+
     if create_torus_btn.value is not None and create_torus_btn.value > 0:
         widget.create_torus(location=(3, 0, 1))
-        widget.render()
+        _needs_render = True
 
     if create_sphere_btn.value is not None and create_sphere_btn.value > 0:
         widget.create_icosphere(location=(-3, 0, 1))
-        widget.render()
+        _needs_render = True
 
     if clear_scene_btn.value is not None and clear_scene_btn.value > 0:
-        widget.clear_scene()
-        widget.setup_lighting()
-        widget.setup_world_background()
-        widget.create_suzanne()
-        widget.create_test_cube()
-        widget.render()
+        widget.rebuild_default_scene()
+        _needs_render = True
+
+    if _needs_render:
+        widget.render_async(if_visible=True)
     return
 
 
@@ -342,10 +396,6 @@ def file_management():
 @app.cell
 def handle_file_imports(clear_imports_btn, file_input, import_btn):
     """Handle File Imports"""
-    import os
-    import tempfile
-    from pathlib import Path
-
     import_status = []
     imported_objects = []
 
@@ -372,15 +422,12 @@ def handle_file_imports(clear_imports_btn, file_input, import_btn):
                     widget.import_alembic(tmp_path)
                     import_status.append(f"✓ Imported Alembic: {uploaded_file.name}")
                 elif _ext == '.obj':
-                    import bpy
                     bpy.ops.wm.obj_import(filepath=tmp_path)
                     import_status.append(f"✓ Imported OBJ: {uploaded_file.name}")
                 elif _ext == '.fbx':
-                    import bpy
                     bpy.ops.import_scene.fbx(filepath=tmp_path)
                     import_status.append(f"✓ Imported FBX: {uploaded_file.name}")
                 elif _ext == '.blend':
-                    import bpy
                     with bpy.data.libraries.load(tmp_path, link=False) as (data_from, data_to):
                         data_to.objects = data_from.objects
                     for obj in data_to.objects:
@@ -388,7 +435,6 @@ def handle_file_imports(clear_imports_btn, file_input, import_btn):
                             bpy.context.collection.objects.link(obj)
                     import_status.append(f"✓ Imported Blender file: {uploaded_file.name}")
                 elif _ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.exr', '.hdr']:
-                    import bpy
                     # Create plane and apply image as texture
                     bpy.ops.mesh.primitive_plane_add()
                     plane = bpy.context.active_object
@@ -420,16 +466,15 @@ def handle_file_imports(clear_imports_btn, file_input, import_btn):
                 import_status.append(f"✗ Failed to import {uploaded_file.name}: {str(e)}")
 
         # Render after imports
-        widget.render()
+        widget.render_async(if_visible=True)
 
     # Clear imported objects
     if clear_imports_btn.value is not None and clear_imports_btn.value > 0:
-        import bpy
         # Remove all objects except camera and light
         for obj in bpy.data.objects:
             if obj.type not in ['CAMERA', 'LIGHT']:
                 bpy.data.objects.remove(obj, do_unlink=True)
-        widget.render()
+        widget.render_async(if_visible=True)
         import_status.append("✓ Cleared all imported objects")
 
     # Display import status
@@ -18,6 +18,7 @@ app = marimo.App()
 
 with app.setup:
     """Setup widget and data directory"""
+    import hashlib
     from pathlib import Path
 
     import marimo as mo
@@ -26,6 +27,9 @@ with app.setup:
 
     from bpy_widget import BpyWidget
 
+    # Seed for the sample point cloud (PCG64 via np.random.default_rng)
+    sample_seed = 0
+
     widget = BpyWidget(width=800, height=600)
     data_dir = Path("sample_data")
     data_dir.mkdir(exist_ok=True)
@@ -41,41 +45,84 @@ def viewport():
 @app.cell
 def create_sample_data():
     """Generate sample datasets"""
-    # Spiral dataset
-    t = np.linspace(0, 4 * np.pi, 100)
-    spiral_data = pl.DataFrame({
-        'x': np.cos(t) * t / 4,
-        'y': np.sin(t) * t / 4,
-        'z': t / 4,
-        'value': np.sin(t * 2),
-        'category': ['A' if i < 50 else 'B' for i in range(100)]
-    })
-    spiral_data.write_csv(data_dir / "spiral.csv")
-
-    # Random point cloud
-    n_points = 500
-    point_cloud = pl.DataFrame({
-        'x': np.random.randn(n_points),
-        'y': np.random.randn(n_points),
-        'z': np.random.randn(n_points) * 0.5,
-        'intensity': np.random.rand(n_points)
-    })
-    point_cloud.write_parquet(data_dir / "points.parquet")
-
-    # Time series
-    time_series = pl.DataFrame({
-        'time': range(50),
-        'signal1': np.sin(np.linspace(0, 2*np.pi, 50)) * 10,
-        'signal2': np.cos(np.linspace(0, 2*np.pi, 50)) * 8,
-        'signal3': np.sin(np.linspace(0, 4*np.pi, 50)) * 6
-    })
-    time_series.write_csv(data_dir / "timeseries.csv")
+    n_spiral, n_points, n_steps = 100, 500, 50
+
+    # The data is deterministic - only regenerate when the parameters change
+    data_key = hashlib.blake2b(
+        f"{n_spiral}|{n_points}|{n_steps}|{sample_seed}|v2".encode(),
+        digest_size=8,
+    ).hexdigest()
+    key_file = data_dir / ".sample_data_key"
+    sample_files = ("spiral.parquet", "points.parquet", "timeseries.csv")
+    data_cached = (
+        key_file.exists()
+        and key_file.read_text() == data_key
+        and all((data_dir / name).exists() for name in sample_files)
+    )
+
+    if not data_cached:
+        # Spiral dataset - one preallocated buffer filled in place by ufuncs
+        t = np.linspace(0, 4 * np.pi, n_spiral, dtype=np.float32)
+        radius = t * 0.25
+        spiral = np.empty((n_spiral, 4), dtype=np.float32)
+        np.cos(t, out=spiral[:, 0])
+        spiral[:, 0] *= radius
+        np.sin(t, out=spiral[:, 1])
+        spiral[:, 1] *= radius
+        spiral[:, 2] = radius
+        np.multiply(t, 2, out=spiral[:, 3])
+        np.sin(spiral[:, 3], out=spiral[:, 3])
+        spiral_data = pl.LazyFrame({
+            'x': spiral[:, 0],
+            'y': spiral[:, 1],
+            'z': spiral[:, 2],
+            'value': spiral[:, 3],
+            # Enum dtype - stored dictionary-encoded instead of one string per row
+            'category': pl.Series(
+                np.where(np.arange(n_spiral) < n_spiral // 2, 'A', 'B'),
+                dtype=pl.Enum(['A', 'B'])
+            )
+        })
+        spiral_data.sink_parquet(data_dir / "spiral.parquet")
+
+        # Random point cloud - one (4, N) buffer so every column is contiguous
+        rng = np.random.default_rng(sample_seed)
+        cloud = np.empty((4, n_points), dtype=np.float32)
+        rng.standard_normal(size=(3, n_points), dtype=np.float32, out=cloud[:3])
+        cloud[2] *= 0.5
+        rng.random(size=n_points, dtype=np.float32, out=cloud[3])
+        point_cloud = pl.LazyFrame({
+            'x': cloud[0],
+            'y': cloud[1],
+            'z': cloud[2],
+            'intensity': cloud[3]
+        })
+        point_cloud.sink_parquet(data_dir / "points.parquet")
+
+        # Time series - share one phase array across all signals
+        lin = np.linspace(0, 2 * np.pi, n_steps)
+        signals = np.empty((n_steps, 3))
+        np.sin(lin, out=signals[:, 0])
+        signals[:, 0] *= 10
+        np.cos(lin, out=signals[:, 1])
+        signals[:, 1] *= 8
+        np.multiply(lin, 2, out=signals[:, 2])
+        np.sin(signals[:, 2], out=signals[:, 2])
+        signals[:, 2] *= 6
+        time_series = pl.LazyFrame({
+            'time': np.arange(n_steps),
+            'signal1': signals[:, 0],
+            'signal2': signals[:, 1],
+            'signal3': signals[:, 2]
+        })
+        time_series.sink_csv(data_dir / "timeseries.csv")
+        key_file.write_text(data_key)
 
     mo.md(f"""
-    **Sample Data Created:**
-    - spiral.csv ({len(spiral_data)} points)
-    - points.parquet ({len(point_cloud)} points)
-    - timeseries.csv ({len(time_series)} rows)
+    **Sample Data {"Cached" if data_cached else "Created"}:**
+    - spiral.parquet ({n_spiral} points)
+    - points.parquet ({n_points} points)
+    - timeseries.csv ({n_steps} rows)
     """)
     return
 
@@ -90,8 +137,8 @@ def import_options():
     )
 
     file_dropdown = mo.ui.dropdown(
-        options=["spiral.csv", "points.parquet", "timeseries.csv"],
-        value="spiral.csv",
+        options=["spiral.parquet", "points.parquet", "timeseries.csv"],
+        value="spiral.parquet",
         label="File"
     )
 
@@ -120,16 +167,20 @@ def apply_import(file_dropdown, import_type):
             x_col="x",
             y_col="y",
             z_col="z",
-            color_col="value" if "spiral" in file_dropdown.value else None
+            # Per-point colors are mapped in one vectorized bulk write
+            color_col={
+                "spiral.parquet": "value",
+                "points.parquet": "intensity",
+            }.get(file_dropdown.value)
         )
         if collection and collection.objects:
-            for obj in collection.objects:
-                point_mat = widget.create_material(
-                    "PointMaterial",
-                    emission_color=(0.3, 0.7, 1.0),
-                    emission_strength=2.0
-                )
-                widget.assign_material(obj, point_mat)
+            # One shared material for all point objects
+            point_mat = widget.create_material(
+                "PointMaterial",
+                emission_color=(0.3, 0.7, 1.0),
+                emission_strength=2.0
+            )
+            widget.assign_material_batch(collection.objects, point_mat)
         widget.setup_camera(distance=12, target=(0, 0, 2))
 
     elif import_type.value == "series":
@@ -155,14 +206,23 @@ def apply_import(file_dropdown, import_type):
             collection_prefix="Data",
             point_size=0.03
         )
+        # Offset each collection along X with one buffered write per collection
         for i, collection in enumerate(collections):
             if collection.objects:
-                for obj in collection.objects:
-                    obj.location.x += i * 5
+                locations = np.empty(len(collection.objects) * 3, dtype=np.float32)
+                collection.objects.foreach_get("location", locations)
+                locations[0::3] += i * 5
+                collection.objects.foreach_set("location", locations)
         widget.setup_camera(distance=20, target=(5, 0, 0))
 
-    widget.render()
-    return
+    # Resolve emission sockets once per import - the slider only writes values
+    emission_inputs = []
+    for material in widget.data.materials:
+        if material.use_nodes:
+            bsdf = material.node_tree.nodes.get("Principled BSDF")
+            if bsdf and bsdf.inputs.get("Emission Strength"):
+                emission_inputs.append(bsdf.inputs["Emission Strength"])
+    return (emission_inputs,)
 
 
 @app.cell
@@ -187,16 +247,11 @@ def visualization_controls():
 
 
 @app.cell
-def apply_viz_settings(emission_strength):
+def apply_viz_settings(emission_inputs, emission_strength):
     """Apply Visualization Settings"""
-    # Update emission strength for all emission materials
-    for material in widget.data.materials:
-        if material.use_nodes:
-            bsdf = material.node_tree.nodes.get("Principled BSDF")
-            if bsdf and bsdf.inputs.get("Emission Strength"):
-                bsdf.inputs["Emission Strength"].default_value = (
-                    emission_strength.value
-                )
+    # Update emission strength on the sockets collected by the import cell
+    for socket in emission_inputs:
+        socket.default_value = emission_strength.value
 
     widget.render()
     return
@@ -80,8 +80,9 @@ def run_benchmark(iterations_slider, resolution_slider, run_benchmark_btn):
         """Benchmark a specific configuration"""
         times = []
         
-        # Setup configuration
-        widget.set_gpu_backend(backend)
+        # Setup configuration (only switch what differs from the previous run)
+        if widget.get_gpu_backend() != backend:
+            widget.set_gpu_backend(backend)
         widget.set_render_engine(engine)
         widget.set_resolution(resolution_slider.value, resolution_slider.value)
         
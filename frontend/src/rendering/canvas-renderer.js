@@ -18,10 +18,9 @@ export class CanvasRenderer {
         this.canvas.style.cursor = 'grab';
     }
     
-    updateDisplay(imageData, width, height) {
-        console.log('CanvasRenderer.updateDisplay called with:', imageData ? imageData.substring(0, 50) + '...' : 'null', width, height);
-        if (imageData && width > 0 && height > 0) {
-            this.renderImage(imageData, width, height);
+    updateDisplay(imageData, width, height, frameWidth = width, frameHeight = height) {
+        if (imageData && imageData.byteLength > 0 && width > 0 && height > 0) {
+            this.renderImage(imageData, width, height, frameWidth, frameHeight);
             this.updateFps();
         } else {
             console.log('CanvasRenderer: No image data, showing placeholder');
@@ -29,7 +28,7 @@ export class CanvasRenderer {
         }
     }
     
-    renderImage(imageData, width, height) {
+    renderImage(imageData, width, height, frameWidth = width, frameHeight = height) {
         // Update canvas internal size (actual pixel dimensions)
         // This must match the render resolution to avoid stretching
         if (this.canvas.width !== width || this.canvas.height !== height) {
@@ -41,30 +40,25 @@ export class CanvasRenderer {
         // which preserves aspect ratio
 
         try {
-            // Handle both raw base64 and data URIs
-            let base64Data = imageData;
-            if (imageData.startsWith('data:image')) {
-                base64Data = imageData.split(',')[1];
-            }
-
-            console.log('renderImage: Decoding base64 data, length:', base64Data.length, 'expected pixels:', width * height * 4);
-
-            // Decode base64 to binary
-            const binaryString = atob(base64Data);
-            console.log('renderImage: Binary string length:', binaryString.length);
-
-            const bytes = new Uint8Array(binaryString.length);
-            for (let i = 0; i < bytes.length; i++) {
-                bytes[i] = binaryString.charCodeAt(i);
-            }
-
-            console.log('renderImage: Created Uint8Array with length:', bytes.length);
+            // Raw RGBA bytes arrive as a DataView over the message buffer - wrap it without copying
+            const pixels = new Uint8ClampedArray(imageData.buffer, imageData.byteOffset, imageData.byteLength);
 
             // Create ImageData and render
-            const imgData = new ImageData(new Uint8ClampedArray(bytes), width, height);
-            this.ctx.putImageData(imgData, 0, 0);
-
-            console.log('renderImage: Image rendered successfully!');
+            const imgData = new ImageData(pixels, frameWidth, frameHeight);
+            if (frameWidth === width && frameHeight === height) {
+                this.ctx.putImageData(imgData, 0, 0);
+            } else {
+                // Reduced-resolution preview (camera drag): upscale to the full canvas
+                if (!this.frameCanvas) {
+                    this.frameCanvas = document.createElement('canvas');
+                }
+                if (this.frameCanvas.width !== frameWidth || this.frameCanvas.height !== frameHeight) {
+                    this.frameCanvas.width = frameWidth;
+                    this.frameCanvas.height = frameHeight;
+                }
+                this.frameCanvas.getContext('2d').putImageData(imgData, 0, 0);
+                this.ctx.drawImage(this.frameCanvas, 0, 0, width, height);
+            }
 
         } catch (error) {
             console.error('Failed to render image:', error);
@@ -117,5 +111,6 @@ export class CanvasRenderer {
     destroy() {
         // Cleanup if needed
         this.ctx = null;
+        this.frameCanvas = null;
     }
 }
@@ -31,6 +31,9 @@ export default {
             const imageData = model.get('image_data');
             const width = model.get('width');
             const height = model.get('height');
+            // Size of the pixels in image_data when it is a reduced preview (0 = full size)
+            const frameWidth = model.get('frame_width') || width;
+            const frameHeight = model.get('frame_height') || height;
             
             // Update widget container aspect ratio to match render resolution
             if (width && height && width > 0 && height > 0) {
@@ -40,8 +43,8 @@ export default {
             
             // Only update display if we have valid image data
             // This prevents clearing the canvas when width/height change before new image_data arrives
-            if (imageData && imageData.length > 0) {
-                renderer.updateDisplay(imageData, width, height);
+            if (imageData && imageData.byteLength > 0) {
+                renderer.updateDisplay(imageData, width, height, frameWidth, frameHeight);
             } else if (width && height && width > 0 && height > 0) {
                 // Only show placeholder if we have dimensions but no image data yet
                 renderer.renderPlaceholder(width, height);
@@ -93,8 +96,12 @@ export default {
         // Initial display
         updateDisplay();
         
+        // Tell Python a view is displayed so deferred renders are flushed
+        model.send({ type: 'viewer_mounted' });
+        
         // Cleanup function (called when widget is destroyed)
         return () => {
+            model.send({ type: 'viewer_unmounted' });
             controls.destroy();
             renderer.destroy();
             statsOverlay.destroy();
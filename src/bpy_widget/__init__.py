@@ -21,7 +21,14 @@ except Exception:
     # Silently fail - datafiles setup is optional and will be retried when widget is created
     pass
 
-from .widget import BpyWidget, BlenderWidget
-
 __version__ = "0.1.1"
 __all__ = ['BpyWidget', 'BlenderWidget']
+
+
+def __getattr__(name):
+    # Load the widget (anywidget/IPython, polars, ...) on first use (PEP 562), so
+    # importing a single core module stays cheap
+    if name in __all__:
+        from . import widget
+        return getattr(widget, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,185 +1,126 @@
 """
 Core functionality for bpy_widget
-"""
-
-from .camera import (
-    calculate_spherical_from_position,
-    setup_camera,
-    update_camera_position,
-    update_camera_spherical,
-)
-from .data_import import (
-    batch_import_data,
-    import_data_as_points,
-    import_data_with_metadata,
-    import_dataframe_as_curve,
-    import_multiple_series,
-    read_data_file,
-)
-from .geometry import (
-    add_subdivision_modifier,
-    apply_modifiers,
-    convert_to_mesh,
-    create_collection,
-    create_curve_object,
-    create_geometry_nodes_modifier,
-    create_icosphere,
-    create_point_cloud,
-    create_suzanne,
-    create_test_cube,
-    create_torus,
-    instance_on_points,
-    join_objects,
-    merge_vertices,
-    set_smooth_shading,
-)
-from .io_handlers import (
-    append_from_blend,
-    export_alembic,
-    export_gltf,
-    export_scene_as_parquet,
-    export_usd,
-    import_alembic,
-    import_gltf,
-    import_scene_from_parquet,
-    import_usd,
-    link_from_blend,
-    load_blend,
-    save_blend,
-)
-from .lighting import (
-    setup_environment_lighting,
-    setup_lighting,
-    setup_sun_light,
-    setup_three_point_lighting,
-    setup_world_background,
-)
-from .materials import (
-    MATERIAL_PRESETS,
-    assign_material,
-    create_material,
-    create_preset_material,
-    get_or_create_material,
-)
-from .nodes import add_glare_node, setup_compositor
-from .post_processing import (
-    add_bloom_glare,
-    add_chromatic_aberration,
-    add_color_correction,
-    add_depth_of_field,
-    add_film_grain,
-    add_motion_blur,
-    add_sharpen,
-    add_vignette,
-    reset_compositor,
-    setup_extended_compositor,
-)
-from .rendering import (
-    enable_compositor_gpu,
-    ensure_gpu_for_eevee,
-    get_gpu_backend,
-    initialize_gpu,
-    render_to_pixels,
-    set_gpu_backend,
-    setup_rendering,
-)
 
-# Extension manager imports (handled directly in widget)
-from .scene import (
-    clear_scene,
-    get_scene,
-)
-from .setup_datafiles import setup_datafiles, setup_datafiles_if_needed
-from .temp_files import cleanup_all, cleanup_file, create_temp_file, get_render_file
+Public names are resolved lazily (PEP 562): importing one core module, e.g.
+``bpy_widget.core.io_handlers``, does not load every other module's dependencies.
+"""
+import importlib
 
-__all__ = [
+# Public name -> defining submodule
+_EXPORTS = {
     # Camera
-    'setup_camera',
-    'update_camera_position',
-    'update_camera_spherical',
-    'calculate_spherical_from_position',
+    'setup_camera': 'camera',
+    'update_camera_position': 'camera',
+    'update_camera_spherical': 'camera',
+    'update_camera_spherical_batch': 'camera',
+    'calculate_spherical_from_position': 'camera',
+    'spherical_to_cartesian': 'camera',
+    'spherical_to_cartesian_batch': 'camera',
     # Data Import
-    'read_data_file',
-    'import_data_as_points',
-    'import_dataframe_as_curve',
-    'import_multiple_series',
-    'batch_import_data',
-    'import_data_with_metadata',
+    'read_data_file': 'data_import',
+    'import_data_as_points': 'data_import',
+    'import_dataframe_as_curve': 'data_import',
+    'import_multiple_series': 'data_import',
+    'batch_import_data': 'data_import',
+    'import_data_with_metadata': 'data_import',
     # Geometry
-    'create_point_cloud',
-    'create_curve_object',
-    'create_icosphere',
-    'create_torus',
-    'create_test_cube',
-    'create_suzanne',
-    'create_collection',
-    'instance_on_points',
-    'join_objects',
-    'convert_to_mesh',
-    'merge_vertices',
-    'set_smooth_shading',
-    'add_subdivision_modifier',
-    'create_geometry_nodes_modifier',
-    'apply_modifiers',
+    'create_point_cloud': 'geometry',
+    'create_curve_object': 'geometry',
+    'create_icosphere': 'geometry',
+    'create_torus': 'geometry',
+    'create_test_cube': 'geometry',
+    'create_suzanne': 'geometry',
+    'create_collection': 'geometry',
+    'instance_on_points': 'geometry',
+    'join_objects': 'geometry',
+    'convert_to_mesh': 'geometry',
+    'merge_vertices': 'geometry',
+    'set_smooth_shading': 'geometry',
+    'add_subdivision_modifier': 'geometry',
+    'create_geometry_nodes_modifier': 'geometry',
+    'apply_modifiers': 'geometry',
     # IO Handlers
-    'import_gltf',
-    'export_gltf',
-    'import_usd',
-    'export_usd',
-    'import_alembic',
-    'export_alembic',
-    'export_scene_as_parquet',
-    'import_scene_from_parquet',
-    'load_blend',
-    'save_blend',
-    'link_from_blend',
-    'append_from_blend',
+    'import_gltf': 'io_handlers',
+    'export_gltf': 'io_handlers',
+    'import_usd': 'io_handlers',
+    'export_usd': 'io_handlers',
+    'import_alembic': 'io_handlers',
+    'export_alembic': 'io_handlers',
+    'export_scene_as_parquet': 'io_handlers',
+    'import_scene_from_parquet': 'io_handlers',
+    'load_blend': 'io_handlers',
+    'save_blend': 'io_handlers',
+    'link_from_blend': 'io_handlers',
+    'append_from_blend': 'io_handlers',
     # Materials
-    'create_material',
-    'create_preset_material',
-    'MATERIAL_PRESETS',
-    'get_or_create_material',
-    'assign_material',
+    'create_material': 'materials',
+    'create_material_cached': 'materials',
+    'clear_material_cache': 'materials',
+    'create_preset_material': 'materials',
+    'MATERIAL_PRESETS': 'materials',
+    'get_or_create_material': 'materials',
+    'assign_material': 'materials',
+    'assign_material_batch': 'materials',
     # Nodes
-    'setup_compositor',
-    'add_glare_node',
+    'setup_compositor': 'nodes',
+    'add_glare_node': 'nodes',
     # Post Processing
-    'setup_extended_compositor',
-    'add_bloom_glare',
-    'add_color_correction',
-    'add_vignette',
-    'add_film_grain',
-    'add_chromatic_aberration',
-    'add_motion_blur',
-    'add_depth_of_field',
-    'add_sharpen',
-    'reset_compositor',
+    'setup_extended_compositor': 'post_processing',
+    'add_bloom_glare': 'post_processing',
+    'add_color_correction': 'post_processing',
+    'add_vignette': 'post_processing',
+    'add_film_grain': 'post_processing',
+    'add_chromatic_aberration': 'post_processing',
+    'add_motion_blur': 'post_processing',
+    'add_depth_of_field': 'post_processing',
+    'add_sharpen': 'post_processing',
+    'build_pipeline': 'post_processing',
+    'reset_compositor': 'post_processing',
     # Rendering
-    'setup_rendering',
-    'render_to_pixels',
-    'set_gpu_backend',
-    'get_gpu_backend',
-    'initialize_gpu',
-    'ensure_gpu_for_eevee',
-    'enable_compositor_gpu',
+    'setup_rendering': 'rendering',
+    'render_to_pixels': 'rendering',
+    'render_sequence': 'rendering',
+    'set_gpu_backend': 'rendering',
+    'get_gpu_backend': 'rendering',
+    'initialize_gpu': 'rendering',
+    'ensure_gpu_for_eevee': 'rendering',
+    'enable_compositor_gpu': 'rendering',
+    'enable_cycles_gpu': 'rendering',
+    'invalidate_gpu_cache': 'rendering',
     # Scene
-    'clear_scene',
-    'get_scene',
+    'clear_scene': 'scene',
+    'get_scene': 'scene',
+    'add_object_to_scene': 'scene',
     # Lighting
-    'setup_lighting',
-    'setup_world_background',
-    'setup_three_point_lighting',
-    'setup_environment_lighting',
-    'setup_sun_light',
+    'setup_lighting': 'lighting',
+    'setup_world_background': 'lighting',
+    'setup_three_point_lighting': 'lighting',
+    'setup_environment_lighting': 'lighting',
+    'setup_sun_light': 'lighting',
     # Temp Files
-    'get_render_file',
-    'create_temp_file',
-    'cleanup_file',
-    'cleanup_all',
+    'get_render_file': 'temp_files',
+    'create_temp_file': 'temp_files',
+    'cleanup_file': 'temp_files',
+    'cleanup_all': 'temp_files',
     # Setup
-    'setup_datafiles',
-    'setup_datafiles_if_needed',
+    'setup_datafiles': 'setup_datafiles',
+    'setup_datafiles_if_needed': 'setup_datafiles',
     # Extensions
-    'install_extension',
-    'search_extensions',
-]
+    'install_extension': 'extension_manager',
+    'search_extensions': 'extension_manager',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,84 @@
 """
 Camera functions for bpy widget
 """
+import functools
 import math
 from typing import Tuple
 
 import bpy
 import mathutils
+import numpy as np
+
+from .scene import add_object_to_scene
+
+# Scratch vector reused by the look-at math so interactive updates don't allocate
+_scratch_direction = mathutils.Vector()
+
+
+def _track_quat(location, target) -> mathutils.Quaternion:
+    """Rotation pointing -Z from location towards target, computed in the scratch vector"""
+    _scratch_direction[:] = (
+        target[0] - location[0],
+        target[1] - location[1],
+        target[2] - location[2],
+    )
+    return _scratch_direction.to_track_quat('-Z', 'Y')
+
+
+def _look_at(camera: bpy.types.Object, rotation) -> None:
+    """Assign a look-at quaternion directly (no quaternion -> euler round trip)"""
+    if camera.rotation_mode != 'QUATERNION':
+        camera.rotation_mode = 'QUATERNION'
+    camera.rotation_quaternion = rotation
+
+
+def spherical_to_cartesian(distance: float, angle_x: float, angle_z: float,
+                           target: Tuple[float, float, float] = (0, 0, 1)) -> Tuple[float, float, float]:
+    """Convert spherical camera coordinates to a cartesian position around target
+    
+    Args:
+        distance: Distance from target
+        angle_x: Elevation angle
+        angle_z: Azimuth angle
+        target: Target point
+    """
+    cos_x = math.cos(angle_x)
+    return (
+        target[0] + distance * cos_x * math.cos(angle_z),
+        target[1] + distance * cos_x * math.sin(angle_z),
+        target[2] + distance * math.sin(angle_x),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _camera_pose(distance: float, angle_x: float, angle_z: float,
+                 target: Tuple[float, float, float]) -> Tuple[Tuple[float, float, float], Tuple[float, float, float, float]]:
+    """Camera location and look-at rotation (quaternion) for spherical coordinates, memoized"""
+    location = spherical_to_cartesian(distance, angle_x, angle_z, target)
+    return location, tuple(_track_quat(location, target))
+
+
+def spherical_to_cartesian_batch(distance, angle_x, angle_z,
+                                 target: Tuple[float, float, float] = (0, 0, 1)) -> np.ndarray:
+    """Vectorized spherical_to_cartesian for whole camera paths
+    
+    Args:
+        distance: Distances, scalar or array of shape (N,)
+        angle_x: Elevation angles, scalar or array of shape (N,)
+        angle_z: Azimuth angles, scalar or array of shape (N,)
+        target: Target point shared by all positions
+        
+    Returns:
+        Array of shape (N, 3) with one position per row
+    """
+    distance, angle_x, angle_z = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(distance, dtype=np.float64)),
+        np.asarray(angle_x, dtype=np.float64),
+        np.asarray(angle_z, dtype=np.float64),
+    )
+    cos_x = np.cos(angle_x)
+    directions = np.stack((cos_x * np.cos(angle_z), cos_x * np.sin(angle_z), np.sin(angle_x)), axis=-1)
+    return np.asarray(target, dtype=np.float64) + distance[:, None] * directions
 
 
 def setup_camera(distance: float = 10.0, target: Tuple[float, float, float] = (0, 0, 1), 
@@ -27,20 +100,13 @@ def setup_camera(distance: float = 10.0, target: Tuple[float, float, float] = (0
     angle_z = -0.785  # azimuth (45 degrees from side)
     
     # Convert to cartesian
-    x = target[0] + distance * math.cos(angle_x) * math.cos(angle_z)
-    y = target[1] + distance * math.cos(angle_x) * math.sin(angle_z)
-    z = target[2] + distance * math.sin(angle_x)
+    x, y, z = spherical_to_cartesian(distance, angle_x, angle_z, target)
     
     # Create camera
-    bpy.ops.object.camera_add(location=(x, y, z))
-    camera = getattr(bpy.context, 'object', None) or bpy.data.objects[-1]  # Get last created object
-    camera.name = "InteractiveCamera"
+    camera = add_object_to_scene("InteractiveCamera", bpy.data.cameras.new("InteractiveCamera"), (x, y, z))
     
     # Look at target
-    camera_location = mathutils.Vector((x, y, z))
-    target_location = mathutils.Vector(target)
-    direction = target_location - camera_location
-    camera.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+    _look_at(camera, _track_quat((x, y, z), target))
     
     # Configure camera sensor to match render aspect ratio
     # Use 'AUTO' sensor fit to automatically adjust to render resolution
@@ -62,10 +128,7 @@ def update_camera_position(location: Tuple[float, float, float], target: Tuple[f
         camera.location = location
         
         # Look at target
-        camera_location = mathutils.Vector(location)
-        target_location = mathutils.Vector(target)
-        direction = target_location - camera_location
-        camera.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+        _look_at(camera, _track_quat(location, target))
 
 
 def update_camera_spherical(distance: float, angle_x: float, angle_z: float, 
@@ -90,22 +153,83 @@ def update_camera_spherical(distance: float, angle_x: float, angle_z: float,
     if not camera:
         return False
     
-    # Convert spherical to cartesian
-    x = target[0] + distance * math.cos(angle_x) * math.cos(angle_z)
-    y = target[1] + distance * math.cos(angle_x) * math.sin(angle_z)
-    z = target[2] + distance * math.sin(angle_x)
+    # Position and look-at rotation - quantized to 1e-4 so repeated poses
+    # (animation loops, snapping, small drag jitter) hit the cache
+    location, rotation = _camera_pose(
+        round(distance, 4),
+        round(angle_x, 4),
+        round(angle_z, 4),
+        tuple(round(float(v), 4) for v in target),
+    )
+    camera.location = location
+    _look_at(camera, rotation)
+    
+    # Ensure sensor fit matches render aspect ratio (skip the RNA write when unchanged)
+    if camera.data.sensor_fit != 'AUTO':
+        camera.data.sensor_fit = 'AUTO'
     
-    # Update position
-    camera.location = (x, y, z)
+    return True
+
+
+def update_camera_spherical_batch(distances, angle_x, angle_z,
+                                  target: Tuple[float, float, float] = (0, 0, 1),
+                                  frame_start: int = None, frame_step: int = 1) -> bool:
+    """Bake a spherical camera path as location/rotation keyframes
     
-    # Look at target
-    camera_location = mathutils.Vector((x, y, z))
-    target_location = mathutils.Vector(target)
-    direction = target_location - camera_location
-    camera.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+    All poses are evaluated in one NumPy pass and written with one
+    foreach_set per F-curve instead of a keyframe_insert per frame.
     
-    # Ensure sensor fit matches render aspect ratio
-    camera.data.sensor_fit = 'AUTO'
+    Args:
+        distances: Distances from target, scalar or array of shape (N,)
+        angle_x: Elevation angles, scalar or array of shape (N,)
+        angle_z: Azimuth angles, scalar or array of shape (N,)
+        target: Target point to look at
+        frame_start: First keyframe (defaults to the scene start frame)
+        frame_step: Frames between consecutive keyframes
+    """
+    scene = bpy.context.scene
+    camera = scene.camera
+    
+    if not camera:
+        setup_camera(target=target, width=scene.render.resolution_x, height=scene.render.resolution_y)
+        camera = scene.camera
+    
+    if not camera:
+        return False
+    
+    locations = spherical_to_cartesian_batch(distances, angle_x, angle_z, target)
+    count = len(locations)
+    _, angle_x, angle_z = np.broadcast_arrays(np.empty(count), angle_x, angle_z)
+    
+    # Look-at quaternion in closed form: Rz(angle_z + pi/2) @ Rx(pi/2 - angle_x)
+    half_x = (math.pi / 2 - angle_x) / 2
+    half_z = (angle_z + math.pi / 2) / 2
+    cos_x, sin_x = np.cos(half_x), np.sin(half_x)
+    cos_z, sin_z = np.cos(half_z), np.sin(half_z)
+    rotations = np.stack((cos_z * cos_x, cos_z * sin_x, sin_z * sin_x, sin_z * cos_x), axis=-1)
+    
+    if frame_start is None:
+        frame_start = scene.frame_start
+    frames = frame_start + frame_step * np.arange(count, dtype=np.float64)
+    
+    # Leave the camera on the first pose and let keyframe_insert create the action/F-curves
+    camera.location = locations[0]
+    _look_at(camera, rotations[0])
+    camera.keyframe_insert('location', frame=frame_start)
+    camera.keyframe_insert('rotation_quaternion', frame=frame_start)
+    action = camera.animation_data.action
+    
+    co = np.empty((count, 2), dtype=np.float32)
+    co[:, 0] = frames
+    for data_path, values in (('location', locations), ('rotation_quaternion', rotations)):
+        for index in range(values.shape[1]):
+            fcurve = action.fcurves.find(data_path, index=index)
+            points = fcurve.keyframe_points
+            points.clear()
+            points.add(count)
+            co[:, 1] = values[:, index]
+            points.foreach_set("co", co.ravel())
+            fcurve.update()
     
     return True
 
@@ -116,8 +240,9 @@ def calculate_spherical_from_position(location: Tuple[float, float, float], targ
     y = location[1] - target[1]
     z = location[2] - target[2]
     
-    distance = math.sqrt(x*x + y*y + z*z)
-    angle_x = math.atan2(z, math.sqrt(x*x + y*y)) if distance > 0 else 0
+    planar = math.hypot(x, y)
+    distance = math.hypot(planar, z)
+    angle_x = math.atan2(z, planar) if distance > 0 else 0
     angle_z = math.atan2(y, x) if distance > 0 else 0
     
     return distance, angle_x, angle_z
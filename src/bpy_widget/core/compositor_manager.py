@@ -13,7 +13,7 @@ Architecture:
         ↓
     Effect 3 (e.g., Vignette)
         ├─→ Composite Output (for final render)
-        └─→ Viewer Output (for live preview)
+        └─→ Viewer Output (for live preview, skipped in background mode)
 """
 
 from typing import Any, Dict, List, Optional, Tuple
@@ -80,25 +80,40 @@ class CompositorChain:
         # Create base nodes
         self.render_layers = self.tree.nodes.new('CompositorNodeRLayers')
         self.composite = self.tree.nodes.new('CompositorNodeComposite')
-        self.viewer = self.tree.nodes.new('CompositorNodeViewer')
 
         # Position nodes for clarity
         self.render_layers.location = (0, 0)
         self.composite.location = (800, 0)
-        self.viewer.location = (800, -300)
+
+        # Background (headless) renders never fill the Viewer image - skip its per-frame upload
+        if bpy.app.background:
+            self.viewer = None
+        else:
+            self.viewer = self.tree.nodes.new('CompositorNodeViewer')
+            self.viewer.location = (800, -300)
 
         # Initial connection: Render Layers → Composite & Viewer
-        self.tree.links.new(
-            self.render_layers.outputs['Image'],
-            self.composite.inputs['Image']
-        )
-        self.tree.links.new(
-            self.render_layers.outputs['Image'],
-            self.viewer.inputs['Image']
-        )
+        self.connect_outputs(self.render_layers.outputs['Image'])
 
         self._initialized = True
 
+    def connect_outputs(self, socket: bpy.types.NodeSocket) -> None:
+        """
+        Route a socket to the Composite (and Viewer, if present) outputs.
+
+        Replaces whatever was connected to their Image inputs before.
+
+        Args:
+            socket: Output socket to display
+        """
+        for output_node in (self.composite, self.viewer):
+            if output_node is None:
+                continue
+            image_input = output_node.inputs['Image']
+            for link in list(image_input.links):
+                self.tree.links.remove(link)
+            self.tree.links.new(socket, image_input)
+
     def add_effect(
         self,
         effect_node: bpy.types.Node,
@@ -160,16 +175,8 @@ class CompositorChain:
             logger.warning(f"Effect node has no Image output")
             return effect_node
 
-        # Remove old connections to Composite and Viewer
-        for link in list(self.tree.links):
-            if link.to_node == self.composite and link.to_socket.name == 'Image':
-                self.tree.links.remove(link)
-            elif link.to_node == self.viewer and link.to_socket.name == 'Image':
-                self.tree.links.remove(link)
-
         # Create new parallel connections (effect → Composite AND Viewer)
-        self.tree.links.new(effect_output, self.composite.inputs['Image'])
-        self.tree.links.new(effect_output, self.viewer.inputs['Image'])
+        self.connect_outputs(effect_output)
 
         # Add to chain
         self.effect_chain.append(effect_node)
@@ -183,6 +190,21 @@ class CompositorChain:
 
         return effect_node
 
+    def get_effect(self, name: str) -> Optional[bpy.types.Node]:
+        """
+        Find an effect in the chain by the name it was added with.
+
+        Args:
+            name: Effect node name
+
+        Returns:
+            The effect node, or None if the chain has no such effect
+        """
+        for node in self.effect_chain:
+            if node.name == name:
+                return node
+        return None
+
     def remove_effect(self, effect_node: bpy.types.Node) -> bool:
         """
         Remove effect from chain and reconnect surrounding nodes.
@@ -219,8 +241,7 @@ class CompositorChain:
                 self.tree.links.new(prev_output, next_input)
             else:
                 # Last effect removed, connect to outputs
-                self.tree.links.new(prev_output, self.composite.inputs['Image'])
-                self.tree.links.new(prev_output, self.viewer.inputs['Image'])
+                self.connect_outputs(prev_output)
         except (IndexError, AttributeError) as e:
             logger.warning(f"Could not reconnect chain after removal: {e}")
 
@@ -241,19 +262,7 @@ class CompositorChain:
         self.effect_chain.clear()
 
         # Restore direct connections
-        for link in list(self.tree.links):
-            if (link.from_node == self.render_layers and
-                link.to_node in (self.composite, self.viewer)):
-                self.tree.links.remove(link)
-
-        self.tree.links.new(
-            self.render_layers.outputs['Image'],
-            self.composite.inputs['Image']
-        )
-        self.tree.links.new(
-            self.render_layers.outputs['Image'],
-            self.viewer.inputs['Image']
-        )
+        self.connect_outputs(self.render_layers.outputs['Image'])
 
         logger.info("All effects cleared")
 
@@ -2,6 +2,7 @@
 Curve creation and manipulation utilities
 """
 import bpy
+import numpy as np
 import polars as pl
 from typing import Optional, List, Union
 from pathlib import Path
@@ -40,10 +41,16 @@ def import_dataframe_as_curve(
     elif x_col and x_col in df.columns:
         df = df.sort(x_col)
     
-    # Get coordinate data
-    x_data = df[x_col].to_numpy() if x_col and x_col in df.columns else list(range(len(df)))
-    y_data = df[y_col].to_numpy() if y_col and y_col in df.columns else [0.0] * len(df)
-    z_data = df[z_col].to_numpy() if z_col and z_col in df.columns else [0.0] * len(df)
+    # Get coordinate data as homogeneous (x, y, z, w) spline coordinates
+    coords = np.zeros((len(df), 4), dtype=np.float32)
+    coords[:, 3] = 1.0
+    if x_col and x_col in df.columns:
+        coords[:, 0] = df[x_col].to_numpy()
+    else:
+        coords[:, 0] = np.arange(len(df))
+    for axis, col in ((1, y_col), (2, z_col)):
+        if col and col in df.columns:
+            coords[:, axis] = df[col].to_numpy()
     
     # Create curve
     curve = bpy.data.curves.new(name=curve_name, type='CURVE')
@@ -53,10 +60,8 @@ def import_dataframe_as_curve(
     spline = curve.splines.new('NURBS')
     spline.points.add(len(df) - 1)
     
-    # Set points
-    for i, (x, y, z) in enumerate(zip(x_data, y_data, z_data)):
-        point = spline.points[i]
-        point.co = (float(x), float(y), float(z), 1.0)
+    # Set points in one bulk write
+    spline.points.foreach_set("co", coords.ravel())
     
     # Create object
     obj = bpy.data.objects.new(curve_name, curve)
@@ -2,6 +2,9 @@
 Data import functionality - Simplified and DRY
 """
 import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
 import polars as pl
 from pathlib import Path
@@ -54,6 +57,21 @@ def import_data_as_points(
     # Read data based on file extension
     df = read_data_file(file_path, **read_kwargs)
     
+    return _create_point_collection(
+        df, collection_name, point_size, x_col, y_col, z_col, color_col
+    )
+
+
+def _create_point_collection(
+    df: pl.DataFrame,
+    collection_name: str,
+    point_size: float,
+    x_col: Optional[str],
+    y_col: Optional[str],
+    z_col: Optional[str],
+    color_col: Optional[str],
+) -> bpy.types.Collection:
+    """Create a point cloud collection from an already loaded dataframe"""
     # Auto-detect coordinate columns if not specified
     detected = auto_detect_columns(df)
     x_col = x_col or detected.get('x')
@@ -89,16 +107,41 @@ def batch_import_data(
     """
     collections = []
     
-    for i, pattern in enumerate(file_patterns):
-        for file_path in glob.glob(pattern):
+    # Split Blender-side options from Polars read options
+    build_keys = ('point_size', 'x_col', 'y_col', 'z_col', 'color_col')
+    build_kwargs = {key: kwargs.pop(key) for key in build_keys if key in kwargs}
+    build_kwargs.setdefault('point_size', 0.1)
+    
+    jobs = [
+        (i, file_path)
+        for i, pattern in enumerate(file_patterns)
+        for file_path in glob.glob(pattern)
+    ]
+    max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+    
+    # Files are decoded on worker threads while the main thread builds objects -
+    # bpy is not thread-safe, so only the Polars reads run in the pool
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(read_data_file, Path(file_path), **kwargs)
+            for _, file_path in jobs
+        ]
+        
+        # Consume in submission order so collection order matches the patterns
+        for (i, file_path), future in zip(jobs, futures):
             try:
+                df = future.result()
                 file_name = Path(file_path).stem
                 collection_name = f"{collection_prefix}_{i:03d}_{file_name}"
                 
-                collection = import_data_as_points(
-                    file_path,
-                    collection_name=collection_name,
-                    **kwargs
+                collection = _create_point_collection(
+                    df,
+                    collection_name,
+                    build_kwargs['point_size'],
+                    build_kwargs.get('x_col'),
+                    build_kwargs.get('y_col'),
+                    build_kwargs.get('z_col'),
+                    build_kwargs.get('color_col'),
                 )
                 collections.append(collection)
                 print(f"✓ Imported: {file_path}")
@@ -52,6 +52,8 @@ def list_extensions(repo_name: Optional[str] = None) -> List[Dict]:
         repo_cache_store = repo_cache_store_ensure()
         
         repos = get_repos()
+        # Enabled add-on modules, collected once instead of addon_utils.check() per package
+        enabled_modules = set(bpy.context.preferences.addons.keys())
         for repo_index, pkg_manifest in enumerate(
             repo_cache_store.pkg_manifest_from_local_ensure(
                 error_fn=print,
@@ -65,6 +67,10 @@ def list_extensions(repo_name: Optional[str] = None) -> List[Dict]:
             if repo_name and repo and repo.name != repo_name:
                 continue
             
+            # Repository-scoped values are the same for every package in it
+            repo_label = repo.name if repo is not None else 'Unknown'
+            module_prefix = f"bl_ext.{repo.module}." if repo is not None else None
+            
             for pkg_id, item in pkg_manifest.items():
                 extensions.append({
                     'id': pkg_id,
@@ -72,8 +78,8 @@ def list_extensions(repo_name: Optional[str] = None) -> List[Dict]:
                     'version': item.version,
                     'type': item.type,  # 'add-on', 'theme', etc.
                     'tagline': item.tagline,
-                    'repository': repo.name if repo else 'Unknown',
-                    'enabled': is_extension_enabled(repo.module if repo else None, pkg_id),
+                    'repository': repo_label,
+                    'enabled': module_prefix is not None and module_prefix + pkg_id in enabled_modules,
                 })
     except ImportError:
         # Fallback - just list enabled extensions
@@ -377,18 +383,22 @@ def search_extensions(query: str, limit: int = 50, category: Optional[str] = Non
 def list_legacy_addons() -> List[Dict]:
     """List legacy addons (not using extension system)"""
     addons = []
+    # Enabled add-on modules, collected once instead of addon_utils.check() per module
+    enabled_modules = set(bpy.context.preferences.addons.keys())
     
     for mod in addon_utils.modules():
+        module_name = mod.__name__
         # Skip new extensions
-        if mod.__name__.startswith('bl_ext.'):
+        if module_name.startswith('bl_ext.'):
             continue
-            
+        
+        bl_info = mod.bl_info
         addons.append({
-            'module': mod.__name__,
-            'name': mod.bl_info.get('name', mod.__name__),
-            'version': '.'.join(str(v) for v in mod.bl_info.get('version', (0, 0, 0))),
-            'category': mod.bl_info.get('category', 'Unknown'),
-            'enabled': addon_utils.check(mod.__name__)[1],
+            'module': module_name,
+            'name': bl_info.get('name', module_name),
+            'version': '.'.join(str(v) for v in bl_info.get('version', (0, 0, 0))),
+            'category': bl_info.get('category', 'Unknown'),
+            'enabled': module_name in enabled_modules,
         })
     
     return addons
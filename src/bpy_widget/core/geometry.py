@@ -3,9 +3,13 @@ Geometry functions for bpy widget
 """
 from typing import List, Optional, Tuple, Union
 
+import bmesh
 import bpy
+import mathutils
+import numpy as np
 
-from .materials import create_material
+from .materials import create_material_cached
+from .scene import add_object_to_scene
 
 
 def create_point_cloud(
@@ -35,9 +39,10 @@ def create_curve_object(
     spline = curve.splines.new(curve_type)
     spline.points.add(len(points) - 1)
     
-    for i, (x, y, z) in enumerate(points):
-        point = spline.points[i]
-        point.co = (x, y, z, 1.0)
+    # Homogeneous (x, y, z, 1) coordinates written in one bulk call
+    coords = np.ones((len(points), 4), dtype=np.float32)
+    coords[:, :3] = points
+    spline.points.foreach_set("co", coords.ravel())
     
     obj = bpy.data.objects.new(name, curve)
     bpy.context.collection.objects.link(obj)
@@ -221,6 +226,17 @@ def apply_modifiers(obj: bpy.types.Object):
         bpy.ops.object.modifier_apply(modifier=modifier.name)
 
 
+def _build_mesh(mesh: bpy.types.Mesh, build) -> None:
+    """Fill a mesh through bmesh (with a UV map), without the primitive_*_add operators"""
+    bm = bmesh.new()
+    try:
+        bm.loops.layers.uv.new("UVMap")
+        build(bm)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+
+
 def create_test_cube(
     location: Tuple[float, float, float] = (0, 0, 0),
     size: float = 2.0,
@@ -237,13 +253,13 @@ def create_test_cube(
     Returns:
         Created cube object
     """
-    bpy.ops.mesh.primitive_cube_add(location=location, size=size)
-    cube = getattr(bpy.context, 'object', None) or bpy.data.objects[-1]  # Get last created object
-    cube.name = "TestCube"
+    mesh = bpy.data.meshes.new("TestCube")
+    _build_mesh(mesh, lambda bm: bmesh.ops.create_cube(bm, size=size, calc_uvs=True))
+    cube = add_object_to_scene("TestCube", mesh, location)
 
     # Apply material
     if material_color:
-        mat = create_material(f"CubeMat_{id(cube)}", base_color=material_color)
+        mat = create_material_cached(f"CubeMat_{id(cube)}", base_color=material_color)
         cube.data.materials.append(mat)
 
     return cube
@@ -265,13 +281,15 @@ def create_suzanne(
     Returns:
         Created Suzanne object
     """
-    bpy.ops.mesh.primitive_monkey_add(location=location, size=size)
-    suzanne = getattr(bpy.context, 'object', None) or bpy.data.objects[-1]  # Get last created object
-    suzanne.name = "Suzanne"
+    # create_monkey builds a size 2 head, like primitive_monkey_add(size=2)
+    mesh = bpy.data.meshes.new("Suzanne")
+    matrix = mathutils.Matrix.Scale(size / 2.0, 4)
+    _build_mesh(mesh, lambda bm: bmesh.ops.create_monkey(bm, matrix=matrix, calc_uvs=True))
+    suzanne = add_object_to_scene("Suzanne", mesh, location)
 
     # Apply material
     if material_color:
-        mat = create_material(f"SuzanneMat_{id(suzanne)}", base_color=material_color)
+        mat = create_material_cached(f"SuzanneMat_{id(suzanne)}", base_color=material_color)
         suzanne.data.materials.append(mat)
 
     return suzanne
@@ -7,7 +7,13 @@ from typing import List, Optional, Union, Dict, Any
 
 import bpy
 import numpy as np
-import polars as pl
+
+_USD_SUFFIXES = frozenset({".usd", ".usda", ".usdc", ".usdz"})
+
+# Output directories already seen to exist - batch exports into one folder skip the re-check
+_existing_dirs = set()
+# Upper bound on _existing_dirs - it is simply emptied when full
+_EXISTING_DIRS_MAX = 256
 
 
 def _validate_output_path(file_path: Path) -> Path:
@@ -24,13 +30,38 @@ def _validate_output_path(file_path: Path) -> Path:
         ValueError: If parent directory does not exist
         PermissionError: If path is not writable
     """
-    if not file_path.parent.exists():
-        raise ValueError(f"Directory does not exist: {file_path.parent}")
-    if file_path.exists() and not os.access(file_path, os.W_OK):
+    # Keyed on the absolute path so a relative path is not reused after chdir
+    # (abspath is pure string work, resolve() would stat every component)
+    parent = os.path.abspath(file_path.parent)
+    if parent not in _existing_dirs:
+        if not os.path.isdir(parent):
+            raise ValueError(f"Directory does not exist: {file_path.parent}")
+        if len(_existing_dirs) >= _EXISTING_DIRS_MAX:
+            _existing_dirs.clear()
+        _existing_dirs.add(parent)
+    try:
+        file_path.stat()
+    except FileNotFoundError:
+        # New file, unless the cached directory has been deleted since
+        if not os.path.isdir(parent):
+            _existing_dirs.discard(parent)
+            raise ValueError(f"Directory does not exist: {file_path.parent}")
+        return file_path  # New file - nothing to overwrite
+    if not os.access(file_path, os.W_OK):
         raise PermissionError(f"Cannot write to {file_path}")
     return file_path
 
 
+def _object_ids() -> set:
+    """Snapshot the ids of all objects (plain ints hash faster than bpy wrappers)"""
+    return {obj.as_pointer() for obj in bpy.data.objects}
+
+
+def _objects_added_since(existing_ids: set) -> List[bpy.types.Object]:
+    """Objects created after an _object_ids() snapshot"""
+    return [obj for obj in bpy.data.objects if obj.as_pointer() not in existing_ids]
+
+
 def import_gltf(
     file_path: Union[str, Path],
     use_custom_normals: bool = True,
@@ -52,7 +83,7 @@ def import_gltf(
         raise FileNotFoundError(f"GLTF file not found: {file_path}")
     
     # Store existing objects
-    existing_objects = set(bpy.data.objects)
+    existing_ids = _object_ids()
     
     # Import GLTF
     bpy.ops.import_scene.gltf(
@@ -63,7 +94,7 @@ def import_gltf(
     )
     
     # Get newly imported objects
-    imported_objects = [obj for obj in bpy.data.objects if obj not in existing_objects]
+    imported_objects = _objects_added_since(existing_ids)
     
     print(f"Imported {len(imported_objects)} objects from {file_path.name}")
     return imported_objects
@@ -91,9 +122,9 @@ def export_gltf(
     file_path = Path(file_path)
 
     # Ensure correct extension
-    if export_format == "GLB" and not file_path.suffix == ".glb":
+    if export_format == "GLB" and file_path.suffix != ".glb":
         file_path = file_path.with_suffix(".glb")
-    elif export_format.startswith("GLTF") and not file_path.suffix == ".gltf":
+    elif export_format.startswith("GLTF") and file_path.suffix != ".gltf":
         file_path = file_path.with_suffix(".gltf")
 
     # Validate output path
@@ -141,7 +172,7 @@ def import_usd(
         raise FileNotFoundError(f"USD file not found: {file_path}")
     
     # Store existing objects
-    existing_objects = set(bpy.data.objects)
+    existing_ids = _object_ids()
     
     # Import USD
     bpy.ops.wm.usd_import(
@@ -157,7 +188,7 @@ def import_usd(
     )
     
     # Get newly imported objects
-    imported_objects = [obj for obj in bpy.data.objects if obj not in existing_objects]
+    imported_objects = _objects_added_since(existing_ids)
     
     print(f"Imported {len(imported_objects)} objects from {file_path.name}")
     return imported_objects
@@ -187,7 +218,7 @@ def export_usd(
     file_path = Path(file_path)
 
     # Ensure correct extension
-    if not file_path.suffix in [".usd", ".usda", ".usdc", ".usdz"]:
+    if file_path.suffix not in _USD_SUFFIXES:
         file_path = file_path.with_suffix(".usd")
 
     # Validate output path
@@ -234,7 +265,7 @@ def import_alembic(
         raise FileNotFoundError(f"Alembic file not found: {file_path}")
     
     # Store existing objects
-    existing_objects = set(bpy.data.objects)
+    existing_ids = _object_ids()
     
     # Import Alembic
     bpy.ops.wm.alembic_import(
@@ -247,7 +278,7 @@ def import_alembic(
     )
     
     # Get newly imported objects
-    imported_objects = [obj for obj in bpy.data.objects if obj not in existing_objects]
+    imported_objects = _objects_added_since(existing_ids)
     
     print(f"Imported {len(imported_objects)} objects from {file_path.name}")
     return imported_objects
@@ -279,7 +310,7 @@ def export_alembic(
     file_path = Path(file_path)
 
     # Ensure correct extension
-    if not file_path.suffix == ".abc":
+    if file_path.suffix != ".abc":
         file_path = file_path.with_suffix(".abc")
 
     # Validate output path
@@ -309,6 +340,11 @@ def export_alembic(
     print(f"Exported to {file_path}")
 
 
+def _transform_sidecar_path(file_path: Path) -> Path:
+    """Path of the per-object transform table written next to a scene Parquet file"""
+    return file_path.with_suffix(".objects.parquet")
+
+
 def export_scene_as_parquet(
     file_path: Union[str, Path],
     include_metadata: bool = True
@@ -318,53 +354,75 @@ def export_scene_as_parquet(
 
     Args:
         file_path: Output file path
-        include_metadata: Include object metadata
+        include_metadata: Write object transforms to a ``.objects.parquet`` sidecar
     """
+    import polars as pl  # Deferred - only the Parquet paths need it
+
     file_path = Path(file_path)
-    if not file_path.suffix == ".parquet":
+    if file_path.suffix != ".parquet":
         file_path = file_path.with_suffix(".parquet")
 
-    # Validate output path
+    # Validate output paths (scene table and transform sidecar)
     _validate_output_path(file_path)
+    sidecar_path = _validate_output_path(_transform_sidecar_path(file_path))
 
-    # Collect scene data
-    data = []
+    # Collect scene data - one column-oriented frame per mesh, read with foreach_get
+    frames = []
+    transforms = []
     for obj in bpy.data.objects:
         if obj.type == 'MESH':
-            mesh = obj.data
-            for vertex in mesh.vertices:
-                row = {
-                    'object_name': obj.name,
-                    'object_type': obj.type,
-                    'vertex_index': vertex.index,
-                    'x': vertex.co.x,
-                    'y': vertex.co.y,
-                    'z': vertex.co.z,
-                    'normal_x': vertex.normal.x,
-                    'normal_y': vertex.normal.y,
-                    'normal_z': vertex.normal.z,
+            vertices = obj.data.vertices
+            count = len(vertices)
+            if not count:
+                continue
+            
+            # One allocation for both attributes; each row stays contiguous for foreach_get
+            buffer = np.empty((2, count * 3), dtype=np.float32)
+            vertices.foreach_get("co", buffer[0])
+            vertices.foreach_get("normal", buffer[1])
+            coords, normals = buffer.reshape(2, count, 3)
+            
+            columns = {
+                'object_name': pl.repeat(obj.name, count, eager=True),
+                'object_type': pl.repeat(obj.type, count, eager=True),
+                'vertex_index': np.arange(count, dtype=np.uint32),
+                'x': coords[:, 0],
+                'y': coords[:, 1],
+                'z': coords[:, 2],
+                'normal_x': normals[:, 0],
+                'normal_y': normals[:, 1],
+                'normal_z': normals[:, 2],
+            }
+            
+            if include_metadata:
+                # One row per object in the sidecar instead of repeating per vertex
+                row = {'object_name': obj.name}
+                transform = {
+                    'location': obj.location,
+                    'rotation': obj.rotation_euler,
+                    'scale': obj.scale,
                 }
-                
-                if include_metadata:
-                    row.update({
-                        'location_x': obj.location.x,
-                        'location_y': obj.location.y,
-                        'location_z': obj.location.z,
-                        'rotation_x': obj.rotation_euler.x,
-                        'rotation_y': obj.rotation_euler.y,
-                        'rotation_z': obj.rotation_euler.z,
-                        'scale_x': obj.scale.x,
-                        'scale_y': obj.scale.y,
-                        'scale_z': obj.scale.z,
-                    })
-                
-                data.append(row)
+                for prefix, values in transform.items():
+                    for axis, value in zip('xyz', values):
+                        row[f'{prefix}_{axis}'] = float(value)
+                transforms.append(row)
+            
+            frames.append(pl.DataFrame(columns))
     
     # Create DataFrame and save
-    if data:
-        df = pl.DataFrame(data)
+    if frames:
+        # Categorical names are dictionary-encoded instead of repeating per vertex
+        df = pl.concat(frames).with_columns(
+            pl.col('object_name').cast(pl.Categorical),
+            pl.col('object_type').cast(pl.Categorical),
+        )
         df.write_parquet(file_path)
-        print(f"Exported {len(data)} vertices to {file_path}")
+        if transforms:
+            pl.DataFrame(transforms).write_parquet(sidecar_path)
+        else:
+            # A sidecar left by an earlier export would be applied to this one on import
+            sidecar_path.unlink(missing_ok=True)
+        print(f"Exported {len(df)} vertices to {file_path}")
     else:
         print("No mesh data to export")
 
@@ -381,6 +439,8 @@ def import_scene_from_parquet(
     Returns:
         List of created objects
     """
+    import polars as pl  # Deferred - only the Parquet paths need it
+
     file_path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"Parquet file not found: {file_path}")
@@ -388,22 +448,27 @@ def import_scene_from_parquet(
     # Read data
     df = pl.read_parquet(file_path)
     
-    # Group by object
+    # Per-object transforms live in a sidecar; older files repeat them per vertex
+    transforms = {}
+    sidecar_path = _transform_sidecar_path(file_path)
+    if sidecar_path.exists():
+        for row in pl.read_parquet(sidecar_path).iter_rows(named=True):
+            transforms[row['object_name']] = row
+    
+    # Group by object - a single partitioning pass instead of one filter per name
     created_objects = []
+    has_inline_transform = 'location_x' in df.columns
     
-    for object_name in df['object_name'].unique():
-        obj_data = df.filter(pl.col('object_name') == object_name)
+    for obj_data in df.partition_by('object_name', maintain_order=True):
+        object_name = obj_data['object_name'][0]
         
         # Create mesh
         mesh = bpy.data.meshes.new(name=object_name)
         
-        # Get vertices
-        vertices = []
-        for row in obj_data.iter_rows(named=True):
-            vertices.append((row['x'], row['y'], row['z']))
-        
-        # Create mesh from vertices
-        mesh.from_pydata(vertices, [], [])
+        # Create vertices from the coordinate columns in one bulk write
+        coords = obj_data.select(['x', 'y', 'z']).to_numpy().astype(np.float32, copy=False)
+        mesh.vertices.add(len(coords))
+        mesh.vertices.foreach_set("co", coords.ravel())
         mesh.update()
         
         # Create object
@@ -411,23 +476,13 @@ def import_scene_from_parquet(
         bpy.context.collection.objects.link(obj)
         
         # Apply transform if available
-        if 'location_x' in obj_data.columns:
-            first_row = obj_data[0]
-            obj.location = (
-                first_row['location_x'][0],
-                first_row['location_y'][0],
-                first_row['location_z'][0]
-            )
-            obj.rotation_euler = (
-                first_row['rotation_x'][0],
-                first_row['rotation_y'][0],
-                first_row['rotation_z'][0]
-            )
-            obj.scale = (
-                first_row['scale_x'][0],
-                first_row['scale_y'][0],
-                first_row['scale_z'][0]
-            )
+        transform = transforms.get(object_name)
+        if transform is None and has_inline_transform:
+            transform = obj_data.row(0, named=True)
+        if transform is not None:
+            obj.location = (transform['location_x'], transform['location_y'], transform['location_z'])
+            obj.rotation_euler = (transform['rotation_x'], transform['rotation_y'], transform['rotation_z'])
+            obj.scale = (transform['scale_x'], transform['scale_y'], transform['scale_z'])
         
         created_objects.append(obj)
     
@@ -447,7 +502,7 @@ def load_blend(file_path: Union[str, Path], load_ui: bool = False) -> None:
     if not file_path.exists():
         raise FileNotFoundError(f"Blend file not found: {file_path}")
     
-    if not file_path.suffix.lower() == '.blend':
+    if file_path.suffix.lower() != '.blend':
         raise ValueError(f"File must be a .blend file: {file_path}")
     
     # Load blend file
@@ -467,7 +522,7 @@ def save_blend(file_path: Union[str, Path], compress: bool = True) -> None:
     file_path = Path(file_path)
     
     # Ensure correct extension
-    if not file_path.suffix.lower() == '.blend':
+    if file_path.suffix.lower() != '.blend':
         file_path = file_path.with_suffix('.blend')
     
     # Validate output path
@@ -499,7 +554,7 @@ def link_from_blend(
     if not file_path.exists():
         raise FileNotFoundError(f"Blend file not found: {file_path}")
     
-    if not file_path.suffix.lower() == '.blend':
+    if file_path.suffix.lower() != '.blend':
         raise ValueError(f"File must be a .blend file: {file_path}")
     
     # Link data from blend file
@@ -580,7 +635,7 @@ def append_from_blend(
     if not file_path.exists():
         raise FileNotFoundError(f"Blend file not found: {file_path}")
     
-    if not file_path.suffix.lower() == '.blend':
+    if file_path.suffix.lower() != '.blend':
         raise ValueError(f"File must be a .blend file: {file_path}")
     
     # Append data from blend file
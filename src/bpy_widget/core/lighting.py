@@ -5,28 +5,29 @@ from typing import Tuple
 
 import bpy
 
+from .scene import add_object_to_scene
+
+
+def _add_light(name: str, light_type: str, location: Tuple[float, float, float]) -> bpy.types.Object:
+    """Create a light object through the data API (no light_add operator)"""
+    return add_object_to_scene(name, bpy.data.lights.new(name, light_type), location)
+
 
 def setup_three_point_lighting():
     """Setup three point lighting - erweitert setup_lighting"""
     # Key Light
-    bpy.ops.object.light_add(type='SUN', location=(4, -4, 6))
-    key_light = bpy.context.object
+    key_light = _add_light("KeyLight", 'SUN', (4, -4, 6))
     key_light.data.energy = 3.0
-    key_light.name = "KeyLight"
     
     # Fill Light  
-    bpy.ops.object.light_add(type='AREA', location=(-3, -2, 4))
-    fill_light = bpy.context.object
+    fill_light = _add_light("FillLight", 'AREA', (-3, -2, 4))
     fill_light.data.energy = 1.0
     fill_light.data.size = 2.0
-    fill_light.name = "FillLight"
     
     # Rim Light
-    bpy.ops.object.light_add(type='SPOT', location=(2, 4, 5))
-    rim_light = bpy.context.object
+    rim_light = _add_light("RimLight", 'SPOT', (2, 4, 5))
     rim_light.data.energy = 2.0
     rim_light.data.spot_size = 1.0
-    rim_light.name = "RimLight"
     
     return key_light, fill_light, rim_light
 
@@ -68,18 +69,14 @@ def setup_lighting(
         add_fill_light: Add a fill light for better illumination
     """
     # Add key light
-    bpy.ops.object.light_add(type='SUN', location=sun_location)
-    sun = getattr(bpy.context, 'object', None) or bpy.data.objects[-1]  # Get last created object
-    if sun:
-        sun.data.energy = sun_energy
-        sun.rotation_euler = (0.3, 0.3, 0)
+    sun = _add_light("Sun", 'SUN', sun_location)
+    sun.data.energy = sun_energy
+    sun.rotation_euler = (0.3, 0.3, 0)
 
     if add_fill_light:
         # Add fill light
-        bpy.ops.object.light_add(type='AREA', location=(-4, -4, 6))
-        fill = getattr(bpy.context, 'object', None) or bpy.data.objects[-1]  # Get last created object
-        if fill:
-            fill.data.energy = sun_energy * 0.3
+        fill = _add_light("Area", 'AREA', (-4, -4, 6))
+        fill.data.energy = sun_energy * 0.3
         fill.data.size = 5
         fill.rotation_euler = (-0.3, -0.3, 0)
 
@@ -108,8 +105,7 @@ def setup_world_background(
 
 def setup_sun_light(energy=2.0, angle=0.785):
     """Setup sun light - analog zu setup_lighting"""
-    bpy.ops.object.light_add(type='SUN', location=(3, -3, 5))
-    sun = getattr(bpy.context, 'object', None) or bpy.data.objects[-1]  # Get last created object
+    sun = _add_light("Sun", 'SUN', (3, -3, 5))
     sun.data.energy = energy
     sun.rotation_euler = (angle, 0, angle)
     return sun
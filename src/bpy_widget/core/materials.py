@@ -1,11 +1,47 @@
 """
 Materials - DRY and functional
 """
+import hashlib
+
 import bpy
-from typing import Dict, Tuple, Union
+from typing import Dict, Iterable, Tuple, Union
 
 ColorType = Union[Tuple[float, float, float], Tuple[float, float, float, float]]
 
+# Materials built by create_material_cached, keyed by their parameter hash
+_material_cache: Dict[str, bpy.types.Material] = {}
+# Whether stamped materials already in bpy.data have been added to _material_cache
+_material_index_built = False
+
+# Custom property stamping a material with its parameter hash (survives file save/reload)
+MATERIAL_HASH_PROP = "bpy_widget_hash"
+
+
+@bpy.app.handlers.persistent
+def _clear_material_cache(*_args):
+    """Drop cached materials before a .blend file replaces bpy.data"""
+    global _material_index_built
+    _material_cache.clear()
+    _material_index_built = False
+
+
+if _clear_material_cache not in bpy.app.handlers.load_pre:
+    bpy.app.handlers.load_pre.append(_clear_material_cache)
+
+
+def clear_material_cache() -> None:
+    """Release the materials kept alive by create_material_cached
+    
+    Removes their fake user, so materials no object uses are dropped by the
+    next orphan purge (e.g. clear_scene) and are not saved into .blend files.
+    """
+    for mat in _material_cache.values():
+        try:
+            mat.use_fake_user = False
+        except ReferenceError:
+            pass  # Material was removed
+    _clear_material_cache()
+
 
 def _ensure_rgba(color: ColorType) -> Tuple[float, float, float, float]:
     """Ensure color is RGBA format"""
@@ -61,6 +97,62 @@ def create_material(
     return mat
 
 
+def create_material_cached(name: str, **kwargs) -> bpy.types.Material:
+    """Create material, reusing an existing one built with identical parameters
+    
+    The returned material may be shared between callers - use create_material
+    for materials that will be edited per object. ``name`` is only used when
+    a new material has to be built. Materials are stamped with a parameter
+    hash, so matches are also found after a .blend reload, and get a fake
+    user so they outlive the objects using them - clear_material_cache()
+    releases them again.
+    
+    Args:
+        name: Material name
+        **kwargs: Parameters for create_material
+    """
+    global _material_index_built
+    if not _material_index_built:
+        # Index stamped materials from a previous run or a loaded file once,
+        # instead of scanning bpy.data.materials on every miss
+        for mat in bpy.data.materials:
+            stamp = mat.get(MATERIAL_HASH_PROP)
+            if stamp is not None:
+                _material_cache.setdefault(stamp, mat)
+        _material_index_built = True
+    
+    key = _material_hash(kwargs)
+    mat = _material_cache.get(key)
+    if mat is not None:
+        try:
+            if bpy.data.materials.get(mat.name) == mat:
+                if not mat.use_fake_user:
+                    mat.use_fake_user = True  # Released by clear_material_cache, cached again
+                return mat
+        except ReferenceError:
+            pass  # Material was removed
+    
+    mat = create_material(name, **kwargs)
+    mat[MATERIAL_HASH_PROP] = key
+    # Survive clear_scene's orphan purge, so scene rebuilds reuse the compiled shader
+    mat.use_fake_user = True
+    _material_cache[key] = mat
+    return mat
+
+
+def _material_hash(kwargs: dict) -> str:
+    """Stable hash of create_material parameters (ints and floats, lists and tuples compare equal)"""
+    def normalize(value):
+        if isinstance(value, (list, tuple)):
+            return tuple(float(v) for v in value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return value
+    
+    items = tuple(sorted((k, normalize(v)) for k, v in kwargs.items()))
+    return hashlib.blake2b(repr(items).encode(), digest_size=12).hexdigest()
+
+
 # Material presets dictionary for quick access
 MATERIAL_PRESETS: Dict[str, Dict] = {
     # Metals
@@ -98,10 +190,36 @@ def create_preset_material(name: str, preset: str) -> bpy.types.Material:
 
 def assign_material(obj: bpy.types.Object, material: bpy.types.Material):
     """Assign material to object"""
-    if obj.data.materials:
-        obj.data.materials[0] = material
-    else:
-        obj.data.materials.append(material)
+    materials = obj.data.materials
+    if not materials:
+        materials.append(material)
+    elif materials[0] != material:
+        materials[0] = material
+
+
+def assign_material_batch(objects: Iterable[bpy.types.Object], material: bpy.types.Material) -> int:
+    """Assign material to many objects, once per shared data-block
+    
+    Objects without material slots (e.g. empties) are skipped.
+    
+    Returns:
+        Number of data-blocks visited
+    """
+    seen = set()
+    for obj in objects:
+        data = obj.data
+        if data is None or not hasattr(data, 'materials'):
+            continue
+        key = data.as_pointer()
+        if key in seen:
+            continue
+        seen.add(key)
+        materials = data.materials
+        if not materials:
+            materials.append(material)
+        elif materials[0] != material:
+            materials[0] = material
+    return len(seen)
 
 
 def get_or_create_material(name: str, **kwargs) -> bpy.types.Material:
@@ -17,10 +17,12 @@ def create_points_from_dataframe(
     point_size: float
 ) -> bpy.types.Object:
     """Create point objects from dataframe"""
-    # Get coordinate data with fallback to 0
-    x_data = df[x_col].to_numpy() if x_col and x_col in df.columns else np.zeros(len(df))
-    y_data = df[y_col].to_numpy() if y_col and y_col in df.columns else np.zeros(len(df))
-    z_data = df[z_col].to_numpy() if z_col and z_col in df.columns else np.zeros(len(df))
+    # Get coordinate data with fallback to 0 - columns are converted straight into
+    # one float32 buffer (to_numpy() aliases the Arrow data for numeric columns)
+    coords = np.zeros((len(df), 3), dtype=np.float32)
+    for axis, col in enumerate((x_col, y_col, z_col)):
+        if col and col in df.columns:
+            coords[:, axis] = df[col].to_numpy()
     
     # Get color data if available
     color_data = df[color_col].to_numpy() if color_col and color_col in df.columns else None
@@ -28,9 +30,9 @@ def create_points_from_dataframe(
     # Create a single mesh with all points (more efficient than individual objects)
     mesh = bpy.data.meshes.new(name=f"{collection.name}_PointCloud")
     
-    # Create vertices
-    vertices = [(float(x), float(y), float(z)) for x, y, z in zip(x_data, y_data, z_data)]
-    mesh.from_pydata(vertices, [], [])
+    # Create vertices - bulk copy of the coordinate buffer instead of per-point tuples
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.ravel())
     mesh.update()
     
     # Create object
@@ -102,12 +104,17 @@ def apply_point_colors(obj: bpy.types.Object, color_data: np.ndarray):
     mesh = obj.data
     color_attr = mesh.attributes.new(name="color", type='FLOAT_COLOR', domain='POINT')
     
-    # Normalize color data to 0-1 range if needed
-    colors = np.array(color_data)
-    if colors.max() > 1.0:
-        colors = colors / colors.max()
-    
-    # Set colors (assuming single value, create gradient)
-    for i, val in enumerate(colors):
-        if i < len(color_attr.data):
-            color_attr.data[i].color = (val, 1.0 - val, 0.5, 1.0)
+    # Normalize color data to 0-1 range if needed (in place on our own float32 copy)
+    colors = np.array(color_data, dtype=np.float32)
+    peak = colors.max()
+    if peak > 1.0:
+        colors /= peak
+    
+    # Set colors (assuming single value, create gradient) in one bulk write
+    count = min(len(colors), len(color_attr.data))
+    rgba = np.zeros((len(color_attr.data), 4), dtype=np.float32)
+    rgba[:count, 0] = colors[:count]
+    rgba[:count, 1] = 1.0 - colors[:count]
+    rgba[:count, 2] = 0.5
+    rgba[:count, 3] = 1.0
+    color_attr.data.foreach_set("color", rgba.ravel())
@@ -3,13 +3,16 @@ Extended post-processing effects for compositor - Blender 4.5 compatible
 
 Uses CompositorChain for robust effect management with automatic
 Viewer Node integration and effect chaining without overwrites.
+Calling an add_* function again updates that effect's nodes in place.
 """
-from typing import Optional, Tuple
+import math
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import bpy
 from loguru import logger
 
-from .compositor_manager import get_compositor_chain
+from .compositor_manager import CompositorChain, get_compositor_chain, reset_compositor_chain
+from .rendering import enable_compositor_gpu
 
 
 def setup_extended_compositor() -> bpy.types.NodeTree:
@@ -23,11 +26,53 @@ def setup_extended_compositor() -> bpy.types.NodeTree:
     chain = get_compositor_chain()
     if not chain._initialized:
         chain.initialize(clear_existing=True)
+    enable_compositor_gpu()
 
     return chain.tree or bpy.context.scene.node_tree
 
 
-def add_bloom_glare(intensity: float = 1.0, threshold: float = 1.0) -> Optional[bpy.types.Node]:
+def _resolve_chain(chain: Optional[CompositorChain] = None) -> CompositorChain:
+    """Return the given chain (or the active scene's), initialized"""
+    if chain is None:
+        chain = get_compositor_chain()
+    if not chain._initialized:
+        chain.initialize()
+    return chain
+
+
+def build_pipeline(
+    effects: Sequence[Tuple[Callable[..., Any], Dict[str, Any]]],
+    chain: Optional[CompositorChain] = None
+) -> CompositorChain:
+    """Apply several effects to one compositor chain.
+
+    The chain (and its node tree) is resolved once and passed to every
+    effect instead of each effect looking up the scene's tree itself.
+
+    Args:
+        effects: Sequence of (add_* function, keyword arguments) pairs, in chain order
+        chain: Compositor chain to use (default: the active scene's chain)
+
+    Returns:
+        The compositor chain the effects were added to
+
+    Example:
+        build_pipeline([
+            (add_bloom_glare, {'intensity': 0.8}),
+            (add_vignette, {'amount': 0.2}),
+        ])
+    """
+    chain = _resolve_chain(chain)
+    for effect, kwargs in effects:
+        effect(**kwargs, chain=chain)
+    return chain
+
+
+def add_bloom_glare(
+    intensity: float = 1.0,
+    threshold: float = 1.0,
+    chain: Optional[CompositorChain] = None
+) -> Optional[bpy.types.Node]:
     """Add bloom/glare effect to the compositor chain.
 
     The effect will automatically:
@@ -38,16 +83,20 @@ def add_bloom_glare(intensity: float = 1.0, threshold: float = 1.0) -> Optional[
     Args:
         intensity: Bloom/glare intensity (0.0-2.0, default 1.0)
         threshold: Threshold for glow detection (0.0-100.0, default 1.0)
+        chain: Compositor chain to use (default: the active scene's chain)
 
     Returns:
         The created Glare node, or None if setup fails
     """
     try:
-        chain = get_compositor_chain()
+        chain = _resolve_chain(chain)
 
-        # Initialize if needed
-        if not chain._initialized:
-            chain.initialize()
+        # Reuse the existing glare node instead of stacking another one
+        glare = chain.get_effect("Bloom_Glare")
+        if glare is not None:
+            glare.threshold = threshold
+            glare.mix = intensity
+            return glare
 
         # Create glare node
         glare = chain.tree.nodes.new('CompositorNodeGlare')
@@ -66,12 +115,44 @@ def add_bloom_glare(intensity: float = 1.0, threshold: float = 1.0) -> Optional[
         return None
 
 
+# Amounts below this disable an effect
+_DISABLED_AMOUNT = 1e-6
+
+
+def _remove_effect(
+    name: str,
+    helper_names: Tuple[str, ...] = (),
+    chain: Optional[CompositorChain] = None
+) -> None:
+    """Remove an effect and its helper nodes so a disabled effect costs nothing per render"""
+    chain = chain or get_compositor_chain()
+    if not chain._initialized or not chain.tree:
+        return
+
+    effect = chain.get_effect(name)
+    if effect is not None:
+        chain.remove_effect(effect)
+    for helper_name in helper_names:
+        helper = chain.tree.nodes.get(helper_name)
+        if helper is not None:
+            chain.tree.nodes.remove(helper)
+
+
+# Color correction nodes in chain order: (node type, effect name)
+_COLOR_CORRECTION_CHAIN = (
+    ('CompositorNodeBrightContrast', "ColorCorrection_BrightContrast"),
+    ('CompositorNodeHueSat', "ColorCorrection_HueSat"),
+    ('CompositorNodeColorBalance', "ColorCorrection"),
+)
+
+
 def add_color_correction(
     brightness: float = 0.0,
     contrast: float = 0.0,
     saturation: float = 1.0,
     gain: Tuple[float, float, float] = (1.0, 1.0, 1.0),
-    gamma: float = 1.0
+    gamma: float = 1.0,
+    chain: Optional[CompositorChain] = None
 ) -> Optional[bpy.types.Node]:
     """Add color correction effect chain to compositor.
 
@@ -84,22 +165,26 @@ def add_color_correction(
         saturation: Saturation multiplier (0.0-2.0, default 1.0)
         gain: RGB gain tuple (0.0-2.0 each, default 1.0)
         gamma: Gamma correction (0.5-2.0, default 1.0)
+        chain: Compositor chain to use (default: the active scene's chain)
 
     Returns:
         The final ColorBalance node (root of the color correction chain)
     """
     try:
-        chain = get_compositor_chain()
-
-        # Initialize if needed
-        if not chain._initialized:
-            chain.initialize()
+        chain = _resolve_chain(chain)
 
-        # Create color correction chain
+        # Reuse an existing color correction chain, otherwise create one
         # Create nodes first, then set values, then link
-        bright_contrast = chain.tree.nodes.new('CompositorNodeBrightContrast')
-        hue_sat = chain.tree.nodes.new('CompositorNodeHueSat')
-        color_balance = chain.tree.nodes.new('CompositorNodeColorBalance')
+        nodes = [chain.get_effect(name) for _, name in _COLOR_CORRECTION_CHAIN]
+        is_new = any(node is None for node in nodes)
+        if is_new:
+            # Rebuild a partial chain from scratch - leftover nodes would keep the
+            # names, so the new ones would become ".001" and never be found again
+            for node in nodes:
+                if node is not None:
+                    chain.remove_effect(node)
+            nodes = [chain.tree.nodes.new(node_type) for node_type, _ in _COLOR_CORRECTION_CHAIN]
+        bright_contrast, hue_sat, color_balance = nodes
         
         # Set node properties BEFORE linking (prevents RNA errors)
         try:
@@ -120,23 +205,10 @@ def add_color_correction(
         except Exception:
             pass
 
-        # Position nodes
-        bright_contrast.location = (200, 0)
-        hue_sat.location = (400, 0)
-        color_balance.location = (600, 0)
-
-        # Chain them: BrightContrast → HueSat → ColorBalance
-        chain.tree.links.new(bright_contrast.outputs['Image'], hue_sat.inputs['Image'])
-        chain.tree.links.new(hue_sat.outputs['Image'], color_balance.inputs['Image'])
-
-        # Connect final output to Composite and Viewer
-        chain.tree.links.new(color_balance.outputs['Image'], chain.composite.inputs['Image'])
-        chain.tree.links.new(color_balance.outputs['Image'], chain.viewer.inputs['Image'])
-
-        # Add to chain tracking
-        chain.effect_chain.append(bright_contrast)
-        chain.effect_chain.append(hue_sat)
-        chain.effect_chain.append(color_balance)
+        # Chain them in table order: previous effect → BrightContrast → HueSat → ColorBalance → outputs
+        if is_new:
+            for node, (_, name) in zip(nodes, _COLOR_CORRECTION_CHAIN):
+                chain.add_effect(node, name=name)
 
         return color_balance
 
@@ -145,7 +217,11 @@ def add_color_correction(
         return None
 
 
-def add_vignette(amount: float = 0.3, center: Tuple[float, float] = (0.5, 0.5)) -> Optional[bpy.types.Node]:
+def add_vignette(
+    amount: float = 0.3,
+    center: Tuple[float, float] = (0.5, 0.5),
+    chain: Optional[CompositorChain] = None
+) -> Optional[bpy.types.Node]:
     """Add vignette effect to compositor chain.
 
     Creates vignette using Ellipse Mask → Invert → Mix blend.
@@ -154,25 +230,38 @@ def add_vignette(amount: float = 0.3, center: Tuple[float, float] = (0.5, 0.5))
     Args:
         amount: Vignette strength (0.0-1.0, default 0.3)
         center: Center point as (x, y) tuple (0.0-1.0, default 0.5, 0.5)
+        chain: Compositor chain to use (default: the active scene's chain)
 
     Returns:
-        The Mix node controlling vignette blending
+        The Mix node controlling vignette blending, or None if amount is 0 (effect removed)
     """
-    try:
-        chain = get_compositor_chain()
+    if abs(amount) < _DISABLED_AMOUNT:
+        _remove_effect("Vignette", ("Vignette_Mask", "Vignette_Invert"), chain)
+        return None
 
-        # Initialize if needed
-        if not chain._initialized:
-            chain.initialize()
+    try:
+        chain = _resolve_chain(chain)
+
+        # Reuse the existing vignette (mask + mix) instead of stacking another one
+        mix = chain.get_effect("Vignette")
+        if mix is not None:
+            mix.inputs['Fac'].default_value = amount
+            ellipse = chain.tree.nodes.get("Vignette_Mask")
+            if ellipse is not None:
+                ellipse.x = center[0]
+                ellipse.y = center[1]
+            return mix
 
         # Create vignette nodes
         ellipse = chain.tree.nodes.new('CompositorNodeEllipseMask')
+        ellipse.name = "Vignette_Mask"
         ellipse.x = center[0]
         ellipse.y = center[1]
         ellipse.width = 1.0
         ellipse.height = 0.75
 
         invert = chain.tree.nodes.new('CompositorNodeInvert')
+        invert.name = "Vignette_Invert"
 
         mix = chain.tree.nodes.new('CompositorNodeMixRGB')
         mix.blend_type = 'MULTIPLY'
@@ -184,25 +273,8 @@ def add_vignette(amount: float = 0.3, center: Tuple[float, float] = (0.5, 0.5))
         # Add to chain (will connect mix to previous output)
         chain.add_effect(mix, name="Vignette")
 
-        # Update internal connections
-        # Find last node before mix in effect_chain
-        mix_index = chain.effect_chain.index(mix)
-        if mix_index > 0:
-            prev_node = chain.effect_chain[mix_index - 1]
-        else:
-            prev_node = chain.render_layers
-
-        # Connect: previous → mix image input, invert mask → mix mask input
-        prev_output = prev_node.outputs.get('Image') or prev_node.outputs[0]
-
-        # Remove old links to mix from prev_node
-        for link in list(chain.tree.links):
-            if link.to_node == mix and link.from_node == prev_node:
-                chain.tree.links.remove(link)
-
-        # Connect properly: image to Image input, mask to second Image (Fac)
-        chain.tree.links.new(prev_output, mix.inputs[1])  # Original image
-        chain.tree.links.new(invert.outputs['Color'], mix.inputs[2])  # Inverted mask
+        # add_effect already fed the previous output into mix.inputs[1]; add the inverted mask
+        chain.tree.links.new(invert.outputs['Color'], mix.inputs[2])
 
         return mix
 
@@ -211,30 +283,40 @@ def add_vignette(amount: float = 0.3, center: Tuple[float, float] = (0.5, 0.5))
         return None
 
 
-def add_film_grain(amount: float = 0.05) -> Optional[bpy.types.Node]:
+def add_film_grain(amount: float = 0.05, chain: Optional[CompositorChain] = None) -> Optional[bpy.types.Node]:
     """Add film grain effect to compositor chain.
 
     Args:
         amount: Grain strength (0.0-1.0, default 0.05)
+        chain: Compositor chain to use (default: the active scene's chain)
 
     Returns:
-        The Mix node controlling grain blending
+        The Mix node controlling grain blending, or None if amount is 0 (effect removed)
     """
+    if abs(amount) < _DISABLED_AMOUNT:
+        _remove_effect("FilmGrain", ("FilmGrain_Texture",), chain)
+        return None
+
     try:
-        chain = get_compositor_chain()
+        chain = _resolve_chain(chain)
 
-        # Initialize if needed
-        if not chain._initialized:
-            chain.initialize()
+        # Reuse the existing grain mix instead of stacking another one
+        mix = chain.get_effect("FilmGrain")
+        if mix is not None:
+            mix.inputs['Fac'].default_value = amount
+            return mix
 
         # Create noise texture
         texture = chain.tree.nodes.new('CompositorNodeTexture')
+        texture.name = "FilmGrain_Texture"
 
-        # Create new texture if needed
-        if not texture.texture:
+        # Reuse the grain texture of a previously removed effect - each
+        # textures.new() would leave another unused FilmGrain.NNN behind
+        tex = bpy.data.textures.get("FilmGrain")
+        if tex is None or tex.type != 'NOISE':
             tex = bpy.data.textures.new("FilmGrain", type='NOISE')
             tex.noise_scale = 0.1
-            texture.texture = tex
+        texture.texture = tex
 
         # Mix node for grain
         mix = chain.tree.nodes.new('CompositorNodeMixRGB')
@@ -254,61 +336,79 @@ def add_film_grain(amount: float = 0.05) -> Optional[bpy.types.Node]:
         return None
 
 
-def add_chromatic_aberration(amount: float = 0.001) -> Optional[bpy.types.Node]:
-    """Add chromatic aberration effect"""
-    tree = bpy.context.scene.node_tree
-    if not tree:
-        return None
-    
-    nodes = tree.nodes
-    links = tree.links
-    
-    # Find composite and source
-    composite = None
-    source_socket = None
-    
-    for node in nodes:
-        if node.type == 'COMPOSITE':
-            composite = node
-            break
-    
-    if not composite:
+def add_chromatic_aberration(amount: float = 0.001, chain: Optional[CompositorChain] = None) -> Optional[bpy.types.Node]:
+    """Add chromatic aberration effect to compositor chain.
+
+    Args:
+        amount: Lens dispersion (0.0-1.0, default 0.001)
+        chain: Compositor chain to use (default: the active scene's chain)
+
+    Returns:
+        The Lens Distortion node, or None if amount is 0 (effect removed)
+    """
+    if abs(amount) < _DISABLED_AMOUNT:
+        _remove_effect("ChromaticAberration", chain=chain)
         return None
-    
-    # Find current input
-    for link in links:
-        if link.to_node == composite and link.to_socket.name == 'Image':
-            source_socket = link.from_socket
-            links.remove(link)
-            break
-    
-    if not source_socket:
+
+    try:
+        chain = _resolve_chain(chain)
+
+        # Reuse the existing lens distortion node instead of stacking another one
+        lens = chain.get_effect("ChromaticAberration")
+        if lens is not None:
+            lens.inputs['Dispersion'].default_value = amount
+            return lens
+
+        # Create lens distortion node
+        lens = chain.tree.nodes.new('CompositorNodeLensdist')
+        lens.use_projector = False
+        lens.inputs['Distort'].default_value = 0.0
+        lens.inputs['Dispersion'].default_value = amount
+
+        # Add to chain (automatically connects)
+        chain.add_effect(lens, name="ChromaticAberration")
+
+        return lens
+
+    except Exception as e:
+        logger.error(f"Failed to add chromatic aberration: {e}")
         return None
-    
-    # Create lens distortion node
-    lens = nodes.new('CompositorNodeLensdist')
-    lens.location = (1100, 0)
-    lens.use_projector = False
-    lens.inputs['Distort'].default_value = 0.0
-    lens.inputs['Dispersion'].default_value = amount
-    
-    # Connect
-    links.new(source_socket, lens.inputs['Image'])
-    links.new(lens.outputs['Image'], composite.inputs['Image'])
-    
-    return lens
+
+
+# Engine -> (scene settings attribute, property) holding the motion blur sample count
+_MOTION_BLUR_SAMPLES_SETTING = {
+    'BLENDER_EEVEE_NEXT': ('eevee', 'motion_blur_steps'),
+    'BLENDER_EEVEE': ('eevee', 'motion_blur_steps'),
+}
+_MOTION_BLUR_MAX_SAMPLES = 64
 
 
 def add_motion_blur(samples: int = 8, shutter: float = 0.5) -> None:
-    """Enable motion blur in render settings"""
+    """Enable motion blur in render settings
+
+    Only settings that actually change are written, so calling this
+    repeatedly (e.g. from a widget control) doesn't invalidate the depsgraph.
+
+    Args:
+        samples: Motion blur samples/steps (clamped to 1-64, EEVEE only)
+        shutter: Shutter time in frames
+    """
     scene = bpy.context.scene
-    scene.render.use_motion_blur = True
-    scene.render.motion_blur_shutter = shutter
-    
-    if scene.render.engine == 'BLENDER_EEVEE_NEXT':
-        scene.eevee.motion_blur_samples = samples
-    elif scene.render.engine == 'CYCLES':
-        scene.cycles.motion_blur_position = 'CENTER'
+    render = scene.render
+    samples = max(1, min(int(samples), _MOTION_BLUR_MAX_SAMPLES))
+
+    if not render.use_motion_blur:
+        render.use_motion_blur = True
+    if not math.isclose(render.motion_blur_shutter, shutter, rel_tol=1e-6):
+        render.motion_blur_shutter = shutter
+
+    setting = _MOTION_BLUR_SAMPLES_SETTING.get(render.engine)
+    if setting is not None:
+        owner = getattr(scene, setting[0])
+        if getattr(owner, setting[1]) != samples:
+            setattr(owner, setting[1], samples)
+    elif render.engine == 'CYCLES' and render.motion_blur_position != 'CENTER':
+        render.motion_blur_position = 'CENTER'
 
 
 def add_depth_of_field(
@@ -334,55 +434,53 @@ def add_depth_of_field(
     print(f"Depth of field enabled: f/{fstop}")
 
 
-def add_sharpen(amount: float = 0.1) -> Optional[bpy.types.Node]:
-    """Add sharpening filter - Simplified for Blender 4.5"""
-    tree = bpy.context.scene.node_tree
-    if not tree:
-        return None
-    
-    nodes = tree.nodes
-    links = tree.links
-    
-    # Find composite and source
-    composite = None
-    source_socket = None
-    
-    for node in nodes:
-        if node.type == 'COMPOSITE':
-            composite = node
-            break
-    
-    if not composite:
+def add_sharpen(amount: float = 0.1, chain: Optional[CompositorChain] = None) -> Optional[bpy.types.Node]:
+    """Add sharpening filter to compositor chain.
+
+    Args:
+        amount: Blend between original and sharpened image (0.0-1.0, default 0.1)
+        chain: Compositor chain to use (default: the active scene's chain)
+
+    Returns:
+        The Mix node controlling sharpen blending, or None if amount is 0 (effect removed)
+    """
+    if abs(amount) < _DISABLED_AMOUNT:
+        _remove_effect("Sharpen", ("Sharpen_Filter",), chain)
         return None
-    
-    # Find current input
-    for link in links:
-        if link.to_node == composite and link.to_socket.name == 'Image':
-            source_socket = link.from_socket
-            links.remove(link)
-            break
-    
-    if not source_socket:
+
+    try:
+        chain = _resolve_chain(chain)
+
+        # Reuse the existing sharpen mix instead of stacking another one
+        mix = chain.get_effect("Sharpen")
+        if mix is not None:
+            mix.inputs['Fac'].default_value = amount
+            return mix
+
+        # Create filter node
+        filter_node = chain.tree.nodes.new('CompositorNodeFilter')
+        filter_node.name = "Sharpen_Filter"
+        filter_node.filter_type = 'SHARPEN'
+
+        # Create mix node to control amount
+        mix = chain.tree.nodes.new('CompositorNodeMixRGB')
+        mix.blend_type = 'MIX'
+        mix.inputs['Fac'].default_value = amount
+
+        # Add to chain (feeds the original image into mix.inputs[1])
+        chain.add_effect(mix, name="Sharpen")
+        filter_node.location = (mix.location[0], mix.location[1] + 200)
+
+        # Sharpen the same source and blend it in as the second image
+        source = mix.inputs[1].links[0].from_socket
+        chain.tree.links.new(source, filter_node.inputs['Image'])
+        chain.tree.links.new(filter_node.outputs['Image'], mix.inputs[2])
+
+        return mix
+
+    except Exception as e:
+        logger.error(f"Failed to add sharpen: {e}")
         return None
-    
-    # Create filter node
-    filter_node = nodes.new('CompositorNodeFilter')
-    filter_node.location = (1000, 200)
-    filter_node.filter_type = 'SHARPEN'
-    
-    # Create mix node to control amount
-    mix = nodes.new('CompositorNodeMixRGB')
-    mix.location = (1150, 200)
-    mix.blend_type = 'MIX'
-    mix.inputs['Fac'].default_value = amount
-    
-    # Connect
-    links.new(source_socket, filter_node.inputs['Image'])
-    links.new(source_socket, mix.inputs[1])  # Original
-    links.new(filter_node.outputs['Image'], mix.inputs[2])  # Sharpened
-    links.new(mix.outputs['Image'], composite.inputs['Image'])
-    
-    return mix
 
 
 def reset_compositor() -> None:
@@ -401,4 +499,7 @@ def reset_compositor() -> None:
         
         tree.links.new(render_layers.outputs['Image'], composite.inputs['Image'])
         
+        # Cached chain nodes were just deleted
+        reset_compositor_chain()
+        
         print("Compositor reset to default")
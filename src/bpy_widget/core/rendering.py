@@ -3,7 +3,8 @@ Rendering functions for bpy widget - Fast & simple
 """
 import os
 import tempfile
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 import bpy
 import numpy as np
@@ -11,8 +12,56 @@ from loguru import logger
 
 from .compositor_manager import get_compositor_chain
 
-# GPU module - available after bpy import
-gpu = None
+# GPU module - ships with bpy, imported up front so the first render doesn't pay for it
+try:
+    import gpu
+    _GPU_AVAILABLE = True
+except ImportError:
+    gpu = None
+    _GPU_AVAILABLE = False
+
+# Cycles compute backends in order of preference
+CYCLES_GPU_BACKENDS = ('OPTIX', 'CUDA', 'HIP', 'ONEAPI', 'METAL')
+
+# Result of the Cycles device probe (None until first probed)
+_cycles_gpu_backend: Optional[str] = None
+
+# (scene pointer, gpu_backend, engine) that setup_rendering last configured the GPU for
+_gpu_configured_for: Optional[Tuple[int, Optional[str], str]] = None
+
+# Results of RNA/GPU capability probes - these don't change while Blender runs
+_capabilities: Dict[str, bool] = {}
+
+# RAM-backed directory for the save_render() round trip (tmpfs on Linux), None = system temp dir
+RENDER_TEMP_DIR: Optional[str] = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Float pixel types render_to_pixels can return (linear values, read through OpenEXR)
+_FLOAT_PIXEL_DTYPES = {'float16': np.float16, 'float32': np.float32}
+
+# Float scratch buffers for pixel readback keyed by pixel count (least recently used first)
+_pixel_buffers: "OrderedDict[int, np.ndarray]" = OrderedDict()
+_PIXEL_BUFFER_CACHE_SIZE = 4
+
+
+def _has_capability(key: str, probe: Callable[[], bool]) -> bool:
+    """Run a capability probe once and remember its result"""
+    result = _capabilities.get(key)
+    if result is None:
+        result = _capabilities[key] = bool(probe())
+    return result
+
+
+def _probe_gpu_backend() -> bool:
+    return hasattr(bpy.context.preferences, 'system') and hasattr(bpy.context.preferences.system, 'gpu_backend')
+
+
+def _probe_gpu_offscreen() -> bool:
+    try:
+        test_offscreen = gpu.types.GPUOffScreen(1, 1)
+        test_offscreen.free()
+        return True
+    except SystemError:
+        return False
 
 
 def set_gpu_backend(backend: str = 'VULKAN') -> bool:
@@ -28,14 +77,11 @@ def set_gpu_backend(backend: str = 'VULKAN') -> bool:
         True if backend was set successfully, False otherwise
     """
     try:
-        if not hasattr(bpy.context.preferences, 'system'):
+        if not _has_capability('gpu_backend', _probe_gpu_backend):
             return False
         
         sys_prefs = bpy.context.preferences.system
         
-        if not hasattr(sys_prefs, 'gpu_backend'):
-            return False
-        
         # Set backend
         backend_upper = backend.upper()
         if backend_upper not in ('VULKAN', 'OPENGL'):
@@ -57,15 +103,10 @@ def get_gpu_backend() -> Optional[str]:
         Current backend ('VULKAN' or 'OPENGL') or None if unavailable
     """
     try:
-        if not hasattr(bpy.context.preferences, 'system'):
-            return None
-        
-        sys_prefs = bpy.context.preferences.system
-        
-        if not hasattr(sys_prefs, 'gpu_backend'):
+        if not _has_capability('gpu_backend', _probe_gpu_backend):
             return None
         
-        return sys_prefs.gpu_backend
+        return bpy.context.preferences.system.gpu_backend
         
     except Exception:
         return None
@@ -85,23 +126,15 @@ def initialize_gpu():
     Returns:
         True if GPU module was initialized successfully, False otherwise
     """
-    global gpu
-    try:
-        if gpu is None:
-            import gpu
-        
-        # Try to check if OpenGL context is available (silently fail in headless mode)
-        try:
-            test_offscreen = gpu.types.GPUOffScreen(1, 1)
-            test_offscreen.free()
-        except SystemError:
-            # OpenGL context not available - expected in headless mode, no need to log
-            pass
-        
-        return True
-    except ImportError:
+    if not _GPU_AVAILABLE:
         logger.warning("GPU module not available - OpenGL rendering may be limited")
         return False
+    
+    try:
+        # Check once if OpenGL context is available (silently fail in headless mode,
+        # where it is expected to be missing - no need to log)
+        _has_capability('gpu_offscreen', _probe_gpu_offscreen)
+        return True
     except Exception:
         return False
 
@@ -157,12 +190,24 @@ def enable_compositor_gpu():
     try:
         scene = bpy.context.scene
         
+        # Blender 4.2+: GPU compositor device - only when a GPU context can be created,
+        # headless machines without one just log EGL errors and fall back. The
+        # compositor runs on OpenGL/Vulkan, so this must not depend on (or change)
+        # the Cycles compute device preferences
+        if _has_capability('compositor_device', lambda: hasattr(scene.render, 'compositor_device')):
+            if not (_GPU_AVAILABLE and _has_capability('gpu_offscreen', _probe_gpu_offscreen)):
+                return False
+            scene.render.compositor_device = 'GPU'
+            scene.render.compositor_precision = 'AUTO'
+            logger.debug("GPU compositing enabled")
+            return True
+        
         # Enable GPU compositing if available (Blender 4.5+)
-        if hasattr(scene.render, 'use_compositor_gpu'):
+        if _has_capability('use_compositor_gpu', lambda: hasattr(scene.render, 'use_compositor_gpu')):
             scene.render.use_compositor_gpu = True
             logger.debug("GPU compositing enabled")
             return True
-        elif hasattr(scene.render, 'use_compositor'):
+        elif _has_capability('use_compositor', lambda: hasattr(scene.render, 'use_compositor')):
             # Fallback: just enable compositing
             scene.render.use_compositor = 'GPU' if hasattr(scene.render, 'compositor_gpu') else True
             logger.debug("Compositing enabled")
@@ -174,7 +219,111 @@ def enable_compositor_gpu():
         return False
 
 
-def setup_rendering(width: int = 1920, height: int = 1080, engine: str = 'BLENDER_EEVEE_NEXT', gpu_backend: Optional[str] = None):
+def enable_cycles_gpu() -> bool:
+    """Enable GPU devices for Cycles rendering
+    
+    Probes the Cycles compute backends in CYCLES_GPU_BACKENDS order and
+    enables every non-CPU device of the first backend that has one.
+    The probe runs once per session; later calls reuse its result.
+    
+    Returns:
+        True if a GPU backend was enabled, False otherwise
+    """
+    global _cycles_gpu_backend
+    if _cycles_gpu_backend == '':
+        return False
+    if _cycles_gpu_backend:
+        # A preferences reload or factory reset switches the backend back - probe again then
+        try:
+            current = bpy.context.preferences.addons['cycles'].preferences.compute_device_type
+        except Exception:
+            current = None
+        if current == _cycles_gpu_backend:
+            return True
+        _cycles_gpu_backend = None
+    
+    try:
+        cprefs = bpy.context.preferences.addons['cycles'].preferences
+        available = {item.identifier for item in cprefs.bl_rna.properties['compute_device_type'].enum_items}
+        previous = cprefs.compute_device_type
+        
+        for backend in CYCLES_GPU_BACKENDS:
+            if backend not in available:
+                continue
+            
+            cprefs.compute_device_type = backend
+            cprefs.get_devices()
+            gpu_devices = [device for device in cprefs.devices if device.type != 'CPU']
+            if not gpu_devices:
+                continue
+            
+            for device in gpu_devices:
+                device.use = True
+            
+            # HIP RT hardware ray tracing (AMD)
+            if backend == 'HIP' and hasattr(cprefs, 'use_hiprt'):
+                cprefs.use_hiprt = True
+            
+            _cycles_gpu_backend = backend
+            logger.debug(f"Cycles GPU enabled: {backend} ({len(gpu_devices)} device(s))")
+            return True
+        
+        # No GPU found - leave the preferences as they were
+        cprefs.compute_device_type = previous
+        
+    except Exception as e:
+        logger.debug(f"Cycles GPU detection failed: {e}")
+    
+    _cycles_gpu_backend = ''
+    return False
+
+
+def _available_cpu_count() -> int:
+    """Number of CPUs this process is allowed to run on (capped at Blender's 1024 thread limit)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return min(1024, max(1, len(os.sched_getaffinity(0))))
+    return min(1024, os.cpu_count() or 1)
+
+
+def _set_if_changed(owner, attr: str, value) -> None:
+    """Assign an RNA property only if it differs (each write tags the depsgraph)"""
+    if getattr(owner, attr) != value:
+        setattr(owner, attr, value)
+
+
+def _apply_cycles_device(scene, device: str) -> None:
+    """Set the Cycles device and the denoiser that can run alongside it"""
+    _set_if_changed(scene.cycles, 'device', device)
+    # OptiX can denoise on the GPU that is already rendering
+    _set_if_changed(scene.cycles, 'denoiser',
+                    'OPTIX' if device == 'GPU' and _cycles_gpu_backend == 'OPTIX' else 'OPENIMAGEDENOISE')
+
+
+@bpy.app.handlers.persistent
+def _forget_gpu_configuration(*_args):
+    """A loaded file (or factory reset) can reuse the old scene's pointer for a new scene"""
+    global _gpu_configured_for
+    _gpu_configured_for = None
+
+
+if _forget_gpu_configuration not in bpy.app.handlers.load_post:
+    bpy.app.handlers.load_post.append(_forget_gpu_configuration)
+
+
+def invalidate_gpu_cache() -> None:
+    """Forget GPU setup results, e.g. after changing the backend or devices externally
+    
+    The next setup_rendering() call re-runs GPU/compositor configuration and
+    re-probes Cycles compute devices.
+    """
+    global _gpu_configured_for, _cycles_gpu_backend
+    _gpu_configured_for = None
+    _cycles_gpu_backend = None
+
+
+def setup_rendering(width: int = 1920, height: int = 1080, engine: str = 'BLENDER_EEVEE_NEXT',
+                    gpu_backend: Optional[str] = None, use_gpu: bool = True,
+                    samples: Optional[int] = None):
     """Configure render settings - simple and fast
     
     Args:
@@ -182,50 +331,77 @@ def setup_rendering(width: int = 1920, height: int = 1080, engine: str = 'BLENDE
         height: Render height in pixels
         engine: Render engine ('BLENDER_EEVEE_NEXT' or 'CYCLES')
         gpu_backend: GPU backend to use ('VULKAN' or 'OPENGL'). If None, uses current setting.
+        use_gpu: Render Cycles on the GPU when a compute device is available
+        samples: Render samples (EEVEE TAA or Cycles). If None, uses 16 for EEVEE and 32 for Cycles
+                 (adaptive sampling + denoising).
     """
+    global _gpu_configured_for
     scene = bpy.context.scene
     
-    # Set GPU backend if specified (Blender 4.5+ supports Vulkan)
-    if gpu_backend is not None:
-        set_gpu_backend(gpu_backend)
-    elif engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'):
-        # For EEVEE, ensure GPU is initialized and backend is available
-        ensure_gpu_for_eevee()
-    
-    # Enable GPU compositing for better performance (Blender 4.5+)
-    enable_compositor_gpu()
+    # GPU setup only needs to run once per scene/backend/engine combination
+    gpu_key = (scene.as_pointer(), gpu_backend, engine)
+    if _gpu_configured_for != gpu_key:
+        # Set GPU backend if specified (Blender 4.5+ supports Vulkan)
+        if gpu_backend is not None:
+            set_gpu_backend(gpu_backend)
+        elif engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'):
+            # For EEVEE, ensure GPU is initialized and backend is available
+            ensure_gpu_for_eevee()
+        
+        # Enable GPU compositing for better performance (Blender 4.5+)
+        enable_compositor_gpu()
+        _gpu_configured_for = gpu_key
     
     # Initialize CompositorChain - Post-Processing is ALWAYS active
     chain = get_compositor_chain()
     if not chain._initialized:
         chain.initialize(clear_existing=False)  # Don't clear existing effects if any
     
-    # Basic settings
-    scene.render.engine = engine
-    scene.render.resolution_x = width
-    scene.render.resolution_y = height
+    # Basic settings - unchanged values are skipped, every RNA write tags
+    # the depsgraph (and an engine write switches engines)
+    render = scene.render
+    _set_if_changed(render, 'engine', engine)
+    _set_if_changed(render, 'resolution_x', width)
+    _set_if_changed(render, 'resolution_y', height)
     
     # Set pixel aspect ratio to 1:1 (square pixels)
-    scene.render.pixel_aspect_x = 1.0
-    scene.render.pixel_aspect_y = 1.0
+    _set_if_changed(render, 'pixel_aspect_x', 1.0)
+    _set_if_changed(render, 'pixel_aspect_y', 1.0)
     
     # Update camera aspect ratio if camera exists
     if scene.camera:
-        scene.camera.data.sensor_fit = 'AUTO'
-    scene.render.resolution_percentage = 100
-    scene.render.film_transparent = False
-    scene.render.image_settings.file_format = 'PNG'
-    scene.render.image_settings.color_mode = 'RGBA'
-    scene.render.image_settings.color_depth = '8'
+        _set_if_changed(scene.camera.data, 'sensor_fit', 'AUTO')
+    _set_if_changed(render, 'resolution_percentage', 100)
+    _set_if_changed(render, 'film_transparent', False)
+    # Keep synced scene data (BVH, shaders) between renders - big win for repeated renders
+    _set_if_changed(render, 'use_persistent_data', True)
+    _set_if_changed(render.image_settings, 'file_format', 'PNG')
+    _set_if_changed(render.image_settings, 'color_mode', 'RGBA')
+    _set_if_changed(render.image_settings, 'color_depth', '8')
     
     if engine == 'CYCLES':
         # Cycles settings
-        scene.cycles.samples = 64
-        scene.cycles.device = 'CPU'  # Most compatible
+        # Few samples: adaptive sampling stops early on converged pixels, the denoiser cleans up the rest
+        _set_if_changed(scene.cycles, 'samples', 32 if samples is None else samples)
+        _set_if_changed(scene.cycles, 'use_adaptive_sampling', True)
+        _set_if_changed(scene.cycles, 'adaptive_min_samples', 4)
+        if abs(scene.cycles.adaptive_threshold - 0.1) > 1e-6:
+            scene.cycles.adaptive_threshold = 0.1
+        # GPU when a compute device is available, CPU otherwise (most compatible)
+        gpu_enabled = use_gpu and enable_cycles_gpu()
+        available_cpus = None if gpu_enabled else _available_cpu_count()
+        if available_cpus is not None and available_cpus < (os.cpu_count() or 1):
+            # Blender's AUTO thread count ignores CPU affinity (containers, taskset) - use
+            # exactly the cores this process may run on. Without a restricted affinity
+            # AUTO is already right, and the user's own thread setting is left alone
+            _set_if_changed(render, 'threads_mode', 'FIXED')
+            _set_if_changed(render, 'threads', available_cpus)
+        _set_if_changed(scene.cycles, 'use_denoising', True)
+        _apply_cycles_device(scene, 'GPU' if gpu_enabled else 'CPU')
     else:
         # EEVEE Next settings - optimized for speed
-        scene.eevee.taa_render_samples = 16
-        scene.eevee.use_raytracing = False
+        _set_if_changed(scene.eevee, 'taa_render_samples', 16 if samples is None else samples)
+        _set_if_changed(scene.eevee, 'use_raytracing', False)
         
     # Configure color management properly for headless operation
     # This prevents "AgX not found" and OpenColorIO warnings
@@ -233,20 +409,20 @@ def setup_rendering(width: int = 1920, height: int = 1080, engine: str = 'BLENDE
         # Set view transform to Standard (always available, unlike AgX)
         # Must be set BEFORE any rendering operations
         if hasattr(scene.view_settings, 'view_transform'):
-            scene.view_settings.view_transform = 'Standard'
+            _set_if_changed(scene.view_settings, 'view_transform', 'Standard')
         
         # Set look to None (no look modification)
         if hasattr(scene.view_settings, 'look'):
-            scene.view_settings.look = 'None'
+            _set_if_changed(scene.view_settings, 'look', 'None')
         
         # Configure display device (sRGB is most compatible for headless)
         if hasattr(scene.display_settings, 'display_device'):
-            scene.display_settings.display_device = 'sRGB'
+            _set_if_changed(scene.display_settings, 'display_device', 'sRGB')
         
         # Configure sequencer color space (if available)
         if hasattr(scene, 'sequencer_colorspace_settings'):
             if hasattr(scene.sequencer_colorspace_settings, 'name'):
-                scene.sequencer_colorspace_settings.name = 'sRGB'
+                _set_if_changed(scene.sequencer_colorspace_settings, 'name', 'sRGB')
             
     except Exception:
         # If color management setup fails, silently continue
@@ -254,24 +430,102 @@ def setup_rendering(width: int = 1920, height: int = 1080, engine: str = 'BLENDE
         pass
 
 
-def render_to_pixels() -> Tuple[Optional[np.ndarray], int, int]:
+def _get_pixel_buffer(pixel_count: int) -> np.ndarray:
+    """Float32 scratch buffer for foreach_get readback
+    
+    Buffers are kept for the last few resolutions, so switching between
+    e.g. preview and final sizes doesn't reallocate every frame.
+    """
+    buffer = _pixel_buffers.pop(pixel_count, None)
+    if buffer is None:
+        buffer = np.empty(pixel_count, dtype=np.float32)
+        if len(_pixel_buffers) >= _PIXEL_BUFFER_CACHE_SIZE:
+            _pixel_buffers.popitem(last=False)
+    _pixel_buffers[pixel_count] = buffer
+    return buffer
+
+
+def _output_buffer(shape: Tuple[int, ...], dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return ``out`` if it can hold the result, otherwise a new array"""
+    if (out is not None and out.shape == shape and out.dtype == dtype
+            and out.flags['C_CONTIGUOUS'] and out.flags['WRITEABLE']):
+        return out
+    return np.empty(shape, dtype=dtype)
+
+
+def _to_display_pixels(pixels_float: np.ndarray, flip_y: bool = True,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert bottom-up float RGBA (0-1) to uint8 RGBA
+    
+    Scales, clips and rounds in place with whole-array ufuncs (the float
+    buffer is consumed), then casts and flips in a single pass by writing
+    through a row-reversed view of the output, so the result stays
+    C-contiguous (cheap tobytes()). Rounding matches Blender's own
+    float-to-byte conversion instead of truncating towards black.
+    """
+    np.multiply(pixels_float, 255.0, out=pixels_float)
+    np.clip(pixels_float, 0.0, 255.0, out=pixels_float)
+    np.rint(pixels_float, out=pixels_float)
+    pixels = _output_buffer(pixels_float.shape, np.uint8, out)
+    target = pixels[::-1] if flip_y else pixels
+    target[...] = pixels_float
+    return pixels
+
+
+def _to_float_pixels(pixels_float: np.ndarray, dtype, flip_y: bool = True,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Copy bottom-up float RGBA out of the scratch buffer as dtype, flipping in the same pass"""
+    pixels = _output_buffer(pixels_float.shape, dtype, out)
+    target = pixels[::-1] if flip_y else pixels
+    target[...] = pixels_float
+    return pixels
+
+
+def _compositor_is_noop(tree: bpy.types.NodeTree) -> bool:
+    """True if every Composite output shows a Render Layers pass unchanged"""
+    for node in tree.nodes:
+        if node.type != 'COMPOSITE':
+            continue
+        links = node.inputs['Image'].links
+        source = links[0].from_node if links else None
+        while source is not None and source.type == 'REROUTE':
+            links = source.inputs[0].links
+            source = links[0].from_node if links else None
+        if source is not None and source.type != 'R_LAYERS':
+            return False
+    return True
+
+
+def render_to_pixels(flip_y: bool = True, dtype: str = 'uint8',
+                     out: Optional[np.ndarray] = None) -> Tuple[Optional[np.ndarray], int, int]:
     """Render scene and return pixel array - via Viewer Node (no file I/O!)
     
     Clean implementation following working example:
     - Remove all nodes, create fresh compositor setup
     - Render to Viewer Node
     - Read pixels directly from Viewer Node image datablock
-    - Falls back to save_render() if Viewer Node doesn't work in headless mode
+    - Uses save_render() in background mode (no Viewer Node) or if the Viewer Node stays empty
+    
+    Args:
+        flip_y: Return rows top-down (display order). With False the rows stay
+            bottom-up as Blender stores them.
+        dtype: 'uint8' for display-ready 8-bit RGBA, or 'float16'/'float32' for the
+            linear (scene-referred) render values, e.g. for HDR or GPU-side quantization.
+        out: Optional (H, W, 4) array to write the pixels into, e.g. the previous
+            frame's array. Ignored (a new array is returned) if shape or dtype don't match.
     """
+    if dtype != 'uint8' and dtype not in _FLOAT_PIXEL_DTYPES:
+        raise ValueError(f"Unsupported pixel dtype: {dtype}")
+    
     if not bpy.context.scene.camera:
         logger.warning("No camera found")
         return None, 0, 0
 
     scene = bpy.context.scene
     
-    # Compositing is ALWAYS active - ensure it's enabled
-    scene.use_nodes = True
-    scene.render.use_compositing = True  # Critical: must be enabled!
+    # Compositor nodes are always set up; whether compositing runs is decided
+    # below, once per render, so use_compositing is written at most once
+    _set_if_changed(scene, 'use_nodes', True)
     
     # Use CompositorChain nodes if available (Post-Processing infrastructure)
     chain = get_compositor_chain()
@@ -298,8 +552,27 @@ def render_to_pixels() -> Tuple[Optional[np.ndarray], int, int]:
         logger.error("Failed to get valid compositor tree")
         return None, 0, 0
     
+    # No Viewer Node in background mode - read the render buffer directly
+    if viewer is None:
+        # A pass-through graph (Render Layers straight into Composite) needs no compositing
+        _set_if_changed(scene.render, 'use_compositing', not _compositor_is_noop(tree))
+        old_filepath = scene.render.filepath
+        try:
+            scene.render.filepath = ""
+            bpy.ops.render.render(write_still=False)
+        except Exception as e:
+            logger.error(f"Render failed: {e}")
+            scene.render.filepath = old_filepath
+            return None, 0, 0
+        return _render_to_pixels_via_save_render(
+            scene, scene.render.resolution_x, scene.render.resolution_y, old_filepath, flip_y, dtype, out
+        )
+    
     links = tree.links
     
+    # The Viewer Node is only filled by the compositor - it must run
+    _set_if_changed(scene.render, 'use_compositing', True)
+    
     # Ensure Viewer Node is properly configured
     # Check if Viewer Node has the correct input socket
     if 'Image' not in viewer.inputs:
@@ -359,14 +632,15 @@ def render_to_pixels() -> Tuple[Optional[np.ndarray], int, int]:
         
         # Verify connection is correct - check if Viewer actually received data
         # In headless mode, Viewer Node might not populate even if connected
-        if not viewer_pixels.pixels or len(viewer_pixels.pixels) == 0:
+        # (the size is enough - the pixel array is only touched once, by foreach_get below)
+        if width == 0 or height == 0:
             logger.warning("Viewer Node has no pixel data - connection might be broken or Viewer Node doesn't work in headless mode")
             scene.render.filepath = old_filepath
             return None, 0, 0
         
-        # Convert to NumPy array (RGBA format, float 0-1)
-        # Use direct slice access as in working example: pixels[:]
-        pixels_float = np.array(viewer_pixels.pixels[:], dtype=np.float32)
+        # Convert to NumPy array (RGBA format, float 0-1) - foreach_get avoids a Python list of floats
+        pixels_float = _get_pixel_buffer(width * height * 4)
+        viewer_pixels.pixels.foreach_get(pixels_float)
         pixels_float = pixels_float.reshape((height, width, 4))
         
         # Check if all pixels are black (0.0) - Viewer Node might not be receiving data in headless mode
@@ -374,13 +648,13 @@ def render_to_pixels() -> Tuple[Optional[np.ndarray], int, int]:
         if pixels_float.max() == 0.0:
             logger.warning("Viewer Node pixels are all black - using save_render() fallback")
             # Use save_render() to access internal render buffer (only reliable method in headless mode)
-            return _render_to_pixels_via_save_render(scene, width, height, old_filepath)
+            return _render_to_pixels_via_save_render(scene, width, height, old_filepath, flip_y, dtype, out)
         
-        # Convert to 8-bit (0-255)
-        pixels_uint8 = (np.clip(pixels_float, 0.0, 1.0) * 255).astype(np.uint8)
-        
-        # Flip vertically (Blender uses bottom-up, we need top-down for display)
-        pixels_array = np.flipud(pixels_uint8)
+        # Convert to 8-bit (or the requested float type) and flip to top-down in one pass
+        if dtype in _FLOAT_PIXEL_DTYPES:
+            pixels_array = _to_float_pixels(pixels_float, _FLOAT_PIXEL_DTYPES[dtype], flip_y, out)
+        else:
+            pixels_array = _to_display_pixels(pixels_float, flip_y, out)
         
         # Restore filepath
         scene.render.filepath = old_filepath
@@ -398,12 +672,98 @@ def render_to_pixels() -> Tuple[Optional[np.ndarray], int, int]:
         return None, 0, 0
 
 
-def _render_to_pixels_via_save_render(scene, width: int, height: int, old_filepath: str) -> Tuple[Optional[np.ndarray], int, int]:
+def render_sequence(frames: Sequence[int]) -> Optional[np.ndarray]:
+    """Render several frames into one array
+    
+    Scene data stays synced between the frames (use_persistent_data),
+    so only the first frame pays for BVH and shader setup.
+    
+    Args:
+        frames: Frame numbers to render, in order
+        
+    Returns:
+        uint8 RGBA array of shape (N, H, W, 4), or None if a render failed
+        
+    Raises:
+        ValueError: If a frame renders at a different resolution than the first
+    """
+    scene = bpy.context.scene
+    original_frame = scene.frame_current
+    original_persistent_data = scene.render.use_persistent_data
+    scene.render.use_persistent_data = True
+    
+    result = None
+    try:
+        for index, frame in enumerate(frames):
+            scene.frame_set(frame)
+            # After the first frame, render straight into the stacked result
+            pixels, width, height = render_to_pixels(out=result[index] if result is not None else None)
+            if pixels is None:
+                return None
+            if result is None:
+                result = np.empty((len(frames), height, width, 4), dtype=np.uint8)
+            elif pixels.shape != result.shape[1:]:
+                # e.g. resolution keyframed or changed by a frame_change handler
+                raise ValueError(
+                    f"Frame {frame} rendered at {width}x{height}, expected "
+                    f"{result.shape[2]}x{result.shape[1]} like the first frame"
+                )
+            if pixels.base is not result:
+                result[index] = pixels
+    finally:
+        scene.frame_set(original_frame)
+        scene.render.use_persistent_data = original_persistent_data
+    
+    return result
+
+
+def _read_targa_rgba(file_path: str, flip_y: bool = True,
+                     out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """Read an uncompressed 32-bit Targa file as uint8 RGBA without a float round trip
+    
+    Returns None for any other Targa layout, so callers can fall back to
+    loading the file through Blender.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    if len(data) < 18:
+        return None
+    id_length, colormap_type, image_type = data[0], data[1], data[2]
+    width = int.from_bytes(data[12:14], 'little')
+    height = int.from_bytes(data[14:16], 'little')
+    bits_per_pixel, descriptor = data[16], data[17]
+    if colormap_type != 0 or image_type != 2 or bits_per_pixel != 32:
+        return None
+    
+    offset = 18 + id_length
+    if len(data) < offset + width * height * 4:
+        return None
+    bgra = np.frombuffer(data, dtype=np.uint8, count=width * height * 4, offset=offset)
+    bgra = bgra.reshape((height, width, 4))
+    
+    # Rows are stored bottom-up unless the top-left origin bit is set
+    if descriptor & 0x20:
+        bgra = bgra[::-1]
+    
+    # Swizzle BGRA -> RGBA and flip in the same pass
+    pixels = _output_buffer((height, width, 4), np.uint8, out)
+    target = pixels[::-1] if flip_y else pixels
+    target[..., :3] = bgra[..., 2::-1]
+    target[..., 3] = bgra[..., 3]
+    return pixels
+
+
+def _render_to_pixels_via_save_render(scene, width: int, height: int, old_filepath: str,
+                                      flip_y: bool = True, dtype: str = 'uint8',
+                                      out: Optional[np.ndarray] = None) -> Tuple[Optional[np.ndarray], int, int]:
     """Fallback: Use save_render() to access internal render buffer (only reliable method in headless mode)
     
     save_render() accesses Blender's internal render buffer and writes to file.
     This is the only reliable way to get pixel data in headless mode when Viewer Node doesn't work.
+    Float dtypes go through OpenEXR, which keeps the linear render values.
     """
+    float_dtype = _FLOAT_PIXEL_DTYPES.get(dtype)
     
     render_result = bpy.data.images.get("Render Result")
     if not render_result:
@@ -412,34 +772,51 @@ def _render_to_pixels_via_save_render(scene, width: int, height: int, old_filepa
         return None, 0, 0
     
     # Use NamedTemporaryFile with delete=False so we can read it after save_render
-    with tempfile.NamedTemporaryFile(mode='wb', suffix='.png', delete=False) as tmp:
+    suffix = '.exr' if float_dtype is not None else '.tga'
+    with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, dir=RENDER_TEMP_DIR, delete=False) as tmp:
         temp_file = tmp.name
     
+    # Uncompressed Targa/EXR keeps alpha and skips compression on write and read
+    image_settings = scene.render.image_settings
+    old_format = image_settings.file_format
+    old_color_mode = image_settings.color_mode
+    old_color_depth = image_settings.color_depth
+    old_exr_codec = image_settings.exr_codec
+    
     try:
+        if float_dtype is not None:
+            image_settings.file_format = 'OPEN_EXR'
+            image_settings.color_depth = '16' if float_dtype is np.float16 else '32'
+            image_settings.exr_codec = 'NONE'
+        else:
+            image_settings.file_format = 'TARGA_RAW'
+        image_settings.color_mode = 'RGBA'
+        
         # save_render() accesses internal render buffer and writes to file
         render_result.save_render(temp_file)
         
-        # Load buffer from file into temporary image datablock
-        temp_img = bpy.data.images.load(temp_file)
+        # A Targa file already holds display-ready 8-bit pixels - read them directly
+        pixels_array = _read_targa_rgba(temp_file, flip_y, out) if float_dtype is None else None
         
-        # Read pixels directly from the loaded buffer
-        pixel_count = temp_img.size[0] * temp_img.size[1] * 4
-        pixels_array_float = np.empty(pixel_count, dtype=np.float32)
-        temp_img.pixels.foreach_get(pixels_array_float)
-        img_data = (pixels_array_float.reshape((temp_img.size[1], temp_img.size[0], 4)) * 255).astype(np.uint8)
+        if pixels_array is None:
+            # EXR or unexpected Targa layout: load buffer from file into temporary image datablock
+            temp_img = bpy.data.images.load(temp_file)
+            
+            # Read pixels directly from the loaded buffer
+            pixel_count = temp_img.size[0] * temp_img.size[1] * 4
+            pixels_array_float = _get_pixel_buffer(pixel_count)
+            temp_img.pixels.foreach_get(pixels_array_float)
+            pixels_array_float = pixels_array_float.reshape((temp_img.size[1], temp_img.size[0], 4))
+            if float_dtype is not None:
+                pixels_array = _to_float_pixels(pixels_array_float, float_dtype, flip_y, out)
+            else:
+                pixels_array = _to_display_pixels(pixels_array_float, flip_y, out)
+            
+            # Clean up temp image immediately
+            bpy.data.images.remove(temp_img)
         
-        # Clean up temp image and file immediately
-        bpy.data.images.remove(temp_img)
         os.unlink(temp_file)
         
-        # Convert to RGBA if needed (should already be RGBA)
-        if img_data.shape[2] == 3:  # RGB -> RGBA
-            alpha = np.full((img_data.shape[0], img_data.shape[1], 1), 255, dtype=np.uint8)
-            img_data = np.concatenate([img_data, alpha], axis=2)
-        
-        # Flip vertically (Blender uses bottom-up, we need top-down for display)
-        pixels_array = np.flipud(img_data)
-        
         result_width, result_height = pixels_array.shape[1], pixels_array.shape[0]
         
         scene.render.filepath = old_filepath
@@ -455,3 +832,8 @@ def _render_to_pixels_via_save_render(scene, width: int, height: int, old_filepa
                 pass
         scene.render.filepath = old_filepath
         return None, 0, 0
+    finally:
+        image_settings.file_format = old_format
+        image_settings.color_mode = old_color_mode
+        image_settings.color_depth = old_color_depth
+        image_settings.exr_codec = old_exr_codec
@@ -1,6 +1,8 @@
 """
 Scene management functions for bpy widget
 """
+from typing import Tuple
+
 import bpy
 
 
@@ -24,19 +26,35 @@ def clear_scene() -> None:
     except Exception:
         pass  # Ignore if color management setup fails
     
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-    # Clean up orphaned data blocks - create list copy to avoid iteration issues
-    for collection in [
-        bpy.data.meshes,
-        bpy.data.materials,
-        bpy.data.textures,
-        bpy.data.images,
-        bpy.data.curves,
-        bpy.data.cameras,
-        bpy.data.lights,
-    ]:
-        for block in list(collection):  # Create copy to avoid race condition
-            if block.users == 0:
-                collection.remove(block)
+    # Remove objects in one call - no operator, no selection changes
+    bpy.data.batch_remove(ids=list(bpy.context.scene.objects))
+
+    # Purge orphaned data blocks in C; recursive so materials/images used only
+    # by the removed meshes go too
+    bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+
+
+def add_object_to_scene(
+    name: str,
+    data: bpy.types.ID,
+    location: Tuple[float, float, float] = (0, 0, 0)
+) -> bpy.types.Object:
+    """Create an object for existing data and link it like the add operators do.
+
+    Skips the operator layer (context resolution, undo push) that
+    bpy.ops.*_add goes through. The new object becomes active and selected.
+
+    Args:
+        name: Object name
+        data: Object data (mesh, camera, light, ...)
+        location: Object location
+
+    Returns:
+        The new object
+    """
+    obj = bpy.data.objects.new(name, data)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    return obj
@@ -107,22 +107,14 @@ class v {
   setupCanvas() {
     this.canvas.style.cursor = "grab";
   }
-  updateDisplay(t, e, s) {
-    console.log("CanvasRenderer.updateDisplay called with:", t ? t.substring(0, 50) + "..." : "null", e, s), t && e > 0 && s > 0 ? (this.renderImage(t, e, s), this.updateFps()) : (console.log("CanvasRenderer: No image data, showing placeholder"), this.renderPlaceholder(e || 512, s || 512));
+  updateDisplay(t, e, s, n = e, h = s) {
+    t && t.byteLength > 0 && e > 0 && s > 0 ? (this.renderImage(t, e, s, n, h), this.updateFps()) : (console.log("CanvasRenderer: No image data, showing placeholder"), this.renderPlaceholder(e || 512, s || 512));
   }
-  renderImage(t, e, s) {
+  renderImage(t, e, s, n = e, h = s) {
     (this.canvas.width !== e || this.canvas.height !== s) && (this.canvas.width = e, this.canvas.height = s);
     try {
-      let n = t;
-      t.startsWith("data:image") && (n = t.split(",")[1]), console.log("renderImage: Decoding base64 data, length:", n.length, "expected pixels:", e * s * 4);
-      const h = atob(n);
-      console.log("renderImage: Binary string length:", h.length);
-      const o = new Uint8Array(h.length);
-      for (let a = 0; a < o.length; a++)
-        o[a] = h.charCodeAt(a);
-      console.log("renderImage: Created Uint8Array with length:", o.length);
-      const l = new ImageData(new Uint8ClampedArray(o), e, s);
-      this.ctx.putImageData(l, 0, 0), console.log("renderImage: Image rendered successfully!");
+      const o = new Uint8ClampedArray(t.buffer, t.byteOffset, t.byteLength), l = new ImageData(o, n, h);
+      n === e && h === s ? this.ctx.putImageData(l, 0, 0) : (this.frameCanvas || (this.frameCanvas = document.createElement("canvas")), (this.frameCanvas.width !== n || this.frameCanvas.height !== h) && (this.frameCanvas.width = n, this.frameCanvas.height = h), this.frameCanvas.getContext("2d").putImageData(l, 0, 0), this.ctx.drawImage(this.frameCanvas, 0, 0, e, s));
     } catch (n) {
       console.error("Failed to render image:", n), this.renderError(e, s, "Render Error");
     }
@@ -145,7 +137,7 @@ class v {
     this.canvas.style.cursor = t;
   }
   destroy() {
-    this.ctx = null;
+    this.ctx = null, this.frameCanvas = null;
   }
 }
 class f {
@@ -180,12 +172,12 @@ const m = {
         `;
     const e = t.querySelector(".bpy-widget"), s = t.querySelector(".viewer-canvas"), n = new v(s), h = new p(s, i), o = new f(e);
     function l() {
-      const a = i.get("image_data"), r = i.get("width"), c = i.get("height");
+      const a = i.get("image_data"), r = i.get("width"), c = i.get("height"), m = i.get("frame_width") || r, w = i.get("frame_height") || c;
       if (r && c && r > 0 && c > 0) {
         const g = r / c;
         e.style.aspectRatio = `${g} / 1`;
       }
-      a && a.length > 0 ? n.updateDisplay(a, r, c) : r && c && r > 0 && c > 0 && n.renderPlaceholder(r, c);
+      a && a.byteLength > 0 ? n.updateDisplay(a, r, c, m, w) : r && c && r > 0 && c > 0 && n.renderPlaceholder(r, c);
       const d = n.getFps(), u = i.get("status");
       o.update(u, d);
     }
@@ -208,8 +200,8 @@ const m = {
     }), i.on("change:status", () => {
       const a = n.getFps(), r = i.get("status");
       o.update(r, a);
-    }), l(), () => {
-      h.destroy(), n.destroy(), o.destroy();
+    }), l(), i.send({ type: "viewer_mounted" }), () => {
+      i.send({ type: "viewer_unmounted" }), h.destroy(), n.destroy(), o.destroy();
     };
   }
 };
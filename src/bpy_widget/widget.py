@@ -1,14 +1,16 @@
 """
 Blender widget for Marimo - Simplified high-performance version
 """
-import base64
-import inspect
+import asyncio
+import concurrent.futures
+import contextlib
+import copy
+import functools
 import io
 import multiprocessing
 import os
 import sys
 import time
-import traceback
 import typing
 import warnings
 from pathlib import Path
@@ -16,7 +18,6 @@ from typing import Optional
 
 import anywidget
 import numpy as np
-import polars as pl
 import traitlets
 from loguru import logger
 
@@ -32,14 +33,6 @@ from .core.camera import (
     setup_camera,
     update_camera_spherical,
 )
-from .core.data_import import (
-    batch_import_data,
-    import_data_as_points,
-    import_data_with_metadata,
-    import_dataframe_as_curve,
-    import_multiple_series,
-)
-from .core.data_readers import read_data_file
 from .core.geometry import (
     create_icosphere,
     create_suzanne,
@@ -68,7 +61,10 @@ from .core.lighting import (
 )
 from .core.materials import (
     assign_material,
+    assign_material_batch,
+    clear_material_cache,
     create_material,
+    create_material_cached,
     create_preset_material,
 )
 from .core.nodes import add_glare_node, setup_compositor
@@ -85,8 +81,11 @@ from .core.post_processing import (
     setup_extended_compositor,
 )
 from .core.rendering import (
+    _apply_cycles_device,
+    _has_capability,
     get_gpu_backend,
     initialize_gpu,
+    render_sequence,
     render_to_pixels,
     set_gpu_backend,
     setup_rendering,
@@ -101,6 +100,64 @@ STATIC_DIR = Path(__file__).parent / 'static'
 
 __all__ = ['BpyWidget', 'BlenderWidget']
 
+# Seconds that list_repositories()/list_extensions() results stay cached
+EXTENSION_CACHE_TTL = 2.0
+
+
+def _invalidates_extension_cache(method):
+    """Clear the widget's cached extension listings after the method runs"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._extension_cache.clear()
+    return wrapper
+
+
+def _setup_eevee_interactive(scene, render_device: typing.Optional[str]):
+    """Fast EEVEE settings for the widget"""
+    eevee = scene.eevee
+    eevee.taa_render_samples = 16
+    eevee.use_raytracing = False
+    # Feature detection instead of version checks, probed once per process
+    if _has_capability('eevee.use_ssr', lambda: hasattr(eevee, 'use_ssr')):
+        eevee.use_ssr = True  # Screen Space Reflections
+    if _has_capability('eevee.use_sss', lambda: hasattr(eevee, 'use_sss')):
+        eevee.use_sss = True  # Subsurface Scattering
+
+
+def _setup_cycles_interactive(scene, render_device: typing.Optional[str]):
+    """Cycles settings for the widget
+    
+    Samples, adaptive sampling, denoising and the device come from
+    setup_rendering()'s defaults; only an explicitly set device trait
+    overrides its GPU detection.
+    """
+    if render_device is not None:
+        _apply_cycles_device(scene, render_device)
+
+
+# Render engine -> widget-specific setup, called as setup(scene, render_device);
+# render_device is None unless the user set the trait
+_ENGINE_SETUP: typing.Dict[str, typing.Callable[[typing.Any, typing.Optional[str]], None]] = {
+    'BLENDER_EEVEE_NEXT': _setup_eevee_interactive,
+    'CYCLES': _setup_cycles_interactive,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _read_static(name: str) -> str:
+    """Read a bundled frontend file once per process"""
+    return (STATIC_DIR / name).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=8)
+def _error_image_bytes(width: int, height: int) -> bytes:
+    """Raw RGBA bytes of the error-mode placeholder, built once per size"""
+    # Repeating one pixel's bytes avoids building an intermediate array
+    return bytes((128, 64, 64, 255)) * (width * height)
+
 
 class BpyWidget(anywidget.AnyWidget):
     """Blender widget with interactive camera control"""
@@ -111,19 +168,22 @@ class BpyWidget(anywidget.AnyWidget):
         if os.getenv("ANYWIDGET_HMR") == "1":
             return "http://localhost:5173/src/widget.js?anywidget"
         else:
-            return (STATIC_DIR / 'widget.js').read_text()
+            return _read_static('widget.js')
 
     @property
     def _css(self):
         if os.getenv("ANYWIDGET_HMR") == "1":
             return ""
         else:
-            return (STATIC_DIR / 'widget.css').read_text()
+            return _read_static('widget.css')
     
     # Widget display traits
-    image_data = traitlets.Unicode('').tag(sync=True)
+    image_data = traitlets.Bytes(b'').tag(sync=True)  # Raw RGBA pixels, sent as a binary buffer
     width = traitlets.Int(1920).tag(sync=True)
     height = traitlets.Int(1080).tag(sync=True)
+    # Pixel size of image_data while it is a reduced-resolution drag preview (0 = width/height)
+    frame_width = traitlets.Int(0).tag(sync=True)
+    frame_height = traitlets.Int(0).tag(sync=True)
     status = traitlets.Unicode('Not initialized').tag(sync=True)
     is_initialized = traitlets.Bool(False).tag(sync=True)
     
@@ -141,25 +201,22 @@ class BpyWidget(anywidget.AnyWidget):
     # Render settings
     render_engine = traitlets.Unicode('BLENDER_EEVEE_NEXT').tag(sync=True)
     render_device = traitlets.Unicode('CPU').tag(sync=True)
+    # Set once render_device is assigned; until then setup_rendering() picks the device
+    _render_device_explicit = False
     
     # Performance settings
     msg_throttle = traitlets.Int(2).tag(sync=True)
+    # Camera changes smaller than this (per distance/angle/target component) do not re-render
+    camera_epsilon = traitlets.Float(1e-3)
 
     def __init__(self, width: int = 1920, height: int = 1080, auto_init: bool = True, **kwargs):
         """Initialize widget"""
         super().__init__(**kwargs)
 
-        # Check if we're in marimo (which uses multiprocessing but widgets should work)
-        self._is_marimo_context = False
-        try:
-            frame = inspect.currentframe()
-            while frame:
-                if 'marimo' in str(frame.f_code.co_filename).lower():
-                    self._is_marimo_context = True
-                    break
-                frame = frame.f_back
-        except:
-            pass
+        # Check if we're in marimo (which uses multiprocessing but widgets should work).
+        # A marimo kernel always has the package imported, so a module lookup
+        # replaces walking the whole call stack.
+        self._is_marimo_context = 'marimo' in sys.modules
 
         # If we're in marimo, use full functionality
         if self._is_marimo_context:
@@ -182,14 +239,29 @@ class BpyWidget(anywidget.AnyWidget):
         self.width = width
         self.height = height
         self._pixel_array: typing.Optional[np.ndarray] = None
-        self._just_initialized = False
+        self._self_update_depth = 0  # > 0 while the widget writes its own camera traits
+        self._last_rendered_camera: typing.Optional[typing.Tuple[float, ...]] = None
+        self._depsgraph_dirty = False  # Scene edited since the last view layer update
         
         # Update infrastructure following Three.js pattern:
         # - Mark updates as needed (like camera controls)
         # - Only render when update() returns True and enough time has passed
-        self._last_render_time = 0.0
+        self._last_render_time = float('-inf')  # perf_counter() of the last render
         self._update_needed = False  # Flag: camera/state changed, render needed
+        self._update_scheduled = False  # A coalesced _update() is queued on the event loop
         self._render_debounce_ms = 20  # Minimum time between renders (~50 FPS max, rendering is ~16ms)
+        # Progressive rendering: reduced resolution while the camera is dragged,
+        # full resolution once it has been idle for _interactive_idle_s
+        self._interactive = False
+        self._interactive_resolution_percentage = 50
+        self._interactive_idle_s = 0.15
+        self._interactive_idle_handle: typing.Optional[asyncio.TimerHandle] = None
+        self._view_count = 0  # Number of mounted frontend views (see _on_frontend_msg)
+        self._has_frontend = False  # A view has been mounted at least once (not headless)
+        self._pending_render: typing.Optional[concurrent.futures.Future] = None
+        self._pending_if_visible = False
+        self._extension_cache: typing.Dict[tuple, typing.Tuple[float, typing.List[typing.Dict]]] = {}
+        self.on_msg(self._on_frontend_msg)
         
         if auto_init:
             self.initialize()
@@ -201,13 +273,8 @@ class BpyWidget(anywidget.AnyWidget):
         self.status = "Error: Multiprocessing not supported"
         self.is_initialized = False
 
-        # Create an error message image (simple colored background)
-        error_image = np.full((height, width, 3), [128, 64, 64], dtype=np.uint8)  # Dark red background
-
-        # Convert to base64 (raw pixel data)
-        pixels_bytes = error_image.tobytes()
-        image_b64 = base64.b64encode(pixels_bytes).decode('ascii')
-        self.image_data = image_b64
+        # Raw RGBA pixel data (simple dark red background)
+        self.image_data = _error_image_bytes(width, height)
 
     def _init_marimo_mode(self, width: int, height: int):
         """Initialize marimo-compatible mode with actual Blender functionality"""
@@ -219,7 +286,7 @@ class BpyWidget(anywidget.AnyWidget):
         self.width = width
         self.height = height
         self._pixel_array: typing.Optional[np.ndarray] = None
-        self._just_initialized = False
+        self._self_update_depth = 0
         self.status = "Marimo mode: Initializing Blender..."
         self.is_initialized = False
 
@@ -369,34 +436,74 @@ class BpyWidget(anywidget.AnyWidget):
             # Ignore errors in warning configuration
             pass
 
+    @contextlib.contextmanager
+    def _self_update(self):
+        """Write traits from Python without the camera observer echoing them back as renders
+        
+        Trait notifications are held so observers see one settled state, and
+        the depth counter lets _on_camera_change ignore changes made here.
+        """
+        self._self_update_depth += 1
+        try:
+            with self.hold_sync(), self.hold_trait_notifications():
+                yield
+        finally:
+            self._self_update_depth -= 1
+
     @traitlets.observe('camera_distance', 'camera_angle_x', 'camera_angle_z', 'camera_target')
     def _on_camera_change(self, change):
         """Handle camera parameter changes from frontend - mark update as needed"""
-        if self.is_initialized and not self._just_initialized:
+        if self.is_initialized and not self._self_update_depth:
+            if self._camera_unchanged():
+                return  # Jitter below camera_epsilon - the last frame is still accurate
+            self._begin_interactive()
             # Mark that an update is needed (Three.js pattern)
             self._update_needed = True
-            # Try to update immediately if enough time has passed
-            self._update()
+            # One render for all camera traits of a gesture, with their latest values
+            self._schedule_update()
     
     @traitlets.observe('render_engine', 'render_device')
     def _on_render_settings_change(self, change):
         """Handle render settings changes"""
+        if change['name'] == 'render_device':
+            # Also reached for constructor kwargs, before initialization
+            self._render_device_explicit = True
         if self.is_initialized:
             scene = get_scene()
             
             # Update render engine
             if change['name'] == 'render_engine':
                 scene.render.engine = change['new']
-                print(f"Render engine changed to: {change['new']}")
+                logger.debug(f"Render engine changed to: {change['new']}")
             
             # Update device (only for Cycles)
             elif change['name'] == 'render_device' and scene.render.engine == 'CYCLES':
-                scene.cycles.device = change['new']
-                print(f"Render device changed to: {change['new']}")
+                _apply_cycles_device(scene, change['new'])
+                logger.debug(f"Render device changed to: {change['new']}")
             
-            # Mark update as needed and try to render
+            # Mark update as needed and render once the change is complete
             self._update_needed = True
-            self._update()
+            self._schedule_update()
+
+    def _on_frontend_msg(self, widget, content, buffers):
+        """Track mounted views reported by the frontend"""
+        msg_type = content.get('type') if isinstance(content, dict) else None
+        if msg_type == 'viewer_mounted':
+            self.mark_visible()
+        elif msg_type == 'viewer_unmounted':
+            self._view_count = max(0, self._view_count - 1)
+
+    def mark_visible(self):
+        """Register a displayed view and flush a render deferred while hidden"""
+        self._view_count += 1
+        self._has_frontend = True
+        if self.is_initialized:
+            self._update(force=True)
+
+    @property
+    def is_visible(self) -> bool:
+        """True if at least one frontend view of the widget is mounted"""
+        return self._view_count > 0
 
     def _update(self, force: bool = False) -> bool:
         """Update and render if needed (Three.js pattern: returns True if rendered)
@@ -415,7 +522,7 @@ class BpyWidget(anywidget.AnyWidget):
         if not self._update_needed:
             return False
         
-        current_time = time.time()
+        current_time = time.perf_counter()
         time_since_last_render = (current_time - self._last_render_time) * 1000.0  # ms
         
         # Check if enough time has passed since last render OR force render
@@ -429,11 +536,80 @@ class BpyWidget(anywidget.AnyWidget):
         # Not enough time has passed, but update is still needed
         return False
 
+    def _schedule_update(self):
+        """Coalesce updates: queue one _update() on the event loop (latest values win)
+        
+        Each camera trait fires its own change notification, so a single drag
+        message would otherwise render up to three times, partly with a
+        half-updated camera. The queued update runs once the current message
+        has been applied, no earlier than the debounce interval after the last
+        render. Without a running loop the update happens immediately.
+        """
+        if self._update_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update()
+            return
+        
+        elapsed_ms = (time.perf_counter() - self._last_render_time) * 1000.0
+        delay = max(0.0, self._render_debounce_ms - elapsed_ms) / 1000.0
+        self._update_scheduled = True
+        loop.call_later(delay, self._service_update)
+    
+    def _service_update(self):
+        """Run an update queued by _schedule_update()"""
+        self._update_scheduled = False
+        self._update(force=True)
+
+    def _camera_state(self) -> typing.Tuple[float, ...]:
+        """Current camera traits as a flat tuple (distance, angle_x, angle_z, *target)"""
+        return (self.camera_distance, self.camera_angle_x, self.camera_angle_z, *self.camera_target)
+    
+    def _camera_unchanged(self) -> bool:
+        """True if the camera traits are within camera_epsilon of the last rendered frame"""
+        if self._last_rendered_camera is None:
+            return False
+        return max(
+            abs(new - old) for new, old in zip(self._camera_state(), self._last_rendered_camera)
+        ) < self.camera_epsilon
+    
+    def _begin_interactive(self):
+        """Render drag previews at reduced resolution until the camera is idle
+        
+        Every camera change restarts the idle timer; when it expires a final
+        full-resolution render is queued. Without a running event loop there
+        is nothing to end the preview, so rendering stays at full resolution.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        if self._interactive_idle_handle is not None:
+            self._interactive_idle_handle.cancel()
+        self._interactive = True
+        self._interactive_idle_handle = loop.call_later(self._interactive_idle_s, self._end_interactive)
+    
+    def _end_interactive(self):
+        """Camera idle: leave preview mode and re-render at full resolution"""
+        self._interactive_idle_handle = None
+        self._interactive = False
+        self._update_needed = True
+        self._schedule_update()
+
     def _update_camera_and_render(self):
         """Update camera and render (called after debounce or immediately)"""
         try:
             # Get camera target (default if not set)
             target = tuple(self.camera_target) if hasattr(self, 'camera_target') else (0, 0, 1)
+            camera_state = self._camera_state()
+            
+            if self._depsgraph_dirty:
+                # One view layer update for all scene edits since the last render
+                bpy.context.view_layer.update()
+                self._depsgraph_dirty = False
             
             # Update camera
             update_camera_spherical(
@@ -446,52 +622,75 @@ class BpyWidget(anywidget.AnyWidget):
             )
             
             # Render (now uses Viewer Node with write_still=False - no file I/O!)
-            start_time = time.time()
-            pixels, w, h = render_to_pixels()
-            render_time = int((time.time() - start_time) * 1000)
+            start_ns = time.perf_counter_ns()
+            preview = self._interactive and self._interactive_resolution_percentage < 100
+            render_settings = get_scene().render
+            old_percentage = render_settings.resolution_percentage
+            if preview:
+                render_settings.resolution_percentage = self._interactive_resolution_percentage
+            try:
+                # Reuse the previous frame's array (its bytes were already copied out for syncing)
+                pixels, w, h = render_to_pixels(out=self._pixel_array)
+            finally:
+                render_settings.resolution_percentage = old_percentage
+            render_time = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             if pixels is not None:
                 # Update display with actual rendered dimensions
                 # (Viewer Node may return different size than requested)
-                self._update_display(pixels, w, h)
+                self._update_display(pixels, w, h, preview=preview)
+                self._last_rendered_camera = camera_state
                 self.status = f"Rendered {w}x{h} ({render_time}ms)"
             else:
                 self.status = "Render failed"
                 
         except Exception as e:
-            logger.error(f"Camera update failed: {e}")
+            logger.exception(f"Camera update failed: {e}")
             self.status = f"Error: {str(e)}"
-            traceback.print_exc()
 
-    def _update_display(self, pixels_array: np.ndarray, w: int, h: int):
+    def _update_display(self, pixels_array: np.ndarray, w: int, h: int, preview: bool = False):
         """Update display from pixel array - synchronizes width/height with actual rendered dimensions
         
         The Viewer Node may return different dimensions than requested (e.g., 256x256 instead of 512x512).
         We need to synchronize the widget traits to match the actual rendered dimensions.
+        A preview frame keeps width/height and reports its own size in frame_width/frame_height,
+        so the frontend scales it up to the full canvas.
         """
         try:
             self._pixel_array = pixels_array
             
-            # Convert to base64 (raw RGBA pixel data, not PNG)
-            # Frontend expects raw pixel bytes, not a PNG image
-            pixels_bytes = pixels_array.tobytes()
-            image_b64 = base64.b64encode(pixels_bytes).decode('ascii')
-            
             # Store original requested dimensions for debug message
             original_w = self.width
             original_h = self.height
+            frame_size = (w, h) if preview else (0, 0)
+            
+            if ((preview or (original_w == w and original_h == h))
+                    and frame_size == (self.frame_width, self.frame_height)):
+                # image_data is the only synced trait, so no hold_sync batching is needed.
+                # An unchanged frame (static scene re-rendered) is not sent again. The
+                # vectorized compare runs in place, so only changed frames pay for tobytes()
+                previous = self.image_data
+                if (len(previous) != pixels_array.nbytes
+                        or not np.array_equal(pixels_array.reshape(-1), np.frombuffer(previous, np.uint8))):
+                    self.image_data = pixels_array.tobytes()
+                return
+            
+            # Raw RGBA pixel data (not PNG) - synced as a binary buffer, no base64 text encoding
+            pixels_bytes = pixels_array.tobytes()
             
             # Update ALL traits together within hold_sync to prevent race conditions
             # This ensures width/height/image_data are all updated atomically
             with self.hold_sync():
                 # Update dimensions if they changed (Viewer Node may return different size)
-                if original_w != w or original_h != h:
+                if not preview and (original_w != w or original_h != h):
                     self.width = w
                     self.height = h
                     logger.debug(f"Render dimensions adjusted: {w}x{h} (requested: {original_w}x{original_h})")
                 
+                self.frame_width, self.frame_height = frame_size
+                
                 # Update image data - this triggers the frontend update with all data ready
-                self.image_data = image_b64
+                self.image_data = pixels_bytes
             
         except Exception as e:
             logger.error(f"Display update failed: {e}")
@@ -512,30 +711,17 @@ class BpyWidget(anywidget.AnyWidget):
             # Setup rendering with current engine
             setup_rendering(self.width, self.height, self.render_engine)
             
-            # Fast EEVEE settings
-            scene = get_scene()
-            if self.render_engine == 'BLENDER_EEVEE_NEXT':
-                scene.eevee.taa_render_samples = 16
-                scene.eevee.use_raytracing = False
-                # Feature detection instead of version checks
-                if hasattr(scene.eevee, 'use_ssr'):
-                    scene.eevee.use_ssr = True  # Screen Space Reflections
-                if hasattr(scene.eevee, 'use_sss'):
-                    scene.eevee.use_sss = True  # Subsurface Scattering
-            elif self.render_engine == 'CYCLES':
-                scene.cycles.samples = 64
-                scene.cycles.device = self.render_device
-                # Feature detection instead of version checks
-                if hasattr(scene.cycles, 'use_adaptive_sampling'):
-                    scene.cycles.use_adaptive_sampling = True
+            # Fast interactive settings for the current engine
+            engine_setup = _ENGINE_SETUP.get(self.render_engine)
+            if engine_setup is not None:
+                engine_setup(get_scene(), self.render_device if self._render_device_explicit else None)
             
             # Setup camera and get initial position
             camera = setup_camera(width=self.width, height=self.height)
             distance, angle_x, angle_z = calculate_spherical_from_position(camera.location)
             
             # Set widget traits from actual camera
-            self._just_initialized = True
-            with self.hold_sync():
+            with self._self_update():
                 self.camera_distance = distance
                 self.camera_angle_x = angle_x
                 self.camera_angle_z = angle_z
@@ -546,39 +732,105 @@ class BpyWidget(anywidget.AnyWidget):
             create_test_cube()
             create_suzanne()
             
-            bpy.context.view_layer.update()
+            self._update_view()
             
             self.is_initialized = True
             
             # Initial render
             self._update_camera_and_render()
-            self._just_initialized = False
             
             logger.info("Widget initialization complete")
             
         except Exception as e:
             self.is_initialized = False
-            self._just_initialized = False
             self.status = f"Error: {str(e)}"
-            logger.error(f"Initialization failed: {e}")
-            traceback.print_exc()
+            logger.exception(f"Initialization failed: {e}")
 
-    def render(self):
-        """Render with error handling"""
+    def render(self, if_visible: bool = False):
+        """Render with error handling
+        
+        Args:
+            if_visible: If True and no view of the widget is displayed, only mark
+                the frame as stale - it is rendered once a view is mounted.
+                Until a frontend has mounted a view (scripts, headless runs)
+                visibility is unknown and the frame is rendered right away.
+        """
         if not self.is_initialized:
             logger.info("Widget not initialized, initializing now...")
             self.initialize()
             return
+        
+        if if_visible and self._has_frontend and not self.is_visible:
+            self._update_needed = True
+            return
             
+        self._update_needed = False
         self._update_camera_and_render()
 
+    def render_async(self, if_visible: bool = False) -> concurrent.futures.Future:
+        """Schedule a render on the running event loop
+        
+        Repeated calls before the loop regains control share one pending render,
+        so several mutating cells cost a single frame. bpy is not thread-safe, so
+        the render still runs on the loop's (main) thread. Without a running loop
+        the render happens immediately.
+        
+        Args:
+            if_visible: Passed through to render()
+            
+        Returns:
+            Future resolved once the scheduled render has run
+        """
+        pending = self._pending_render
+        if pending is not None and not pending.done():
+            self._pending_if_visible = self._pending_if_visible and if_visible
+            return pending
+        
+        future = concurrent.futures.Future()
+        self._pending_render = future
+        self._pending_if_visible = if_visible
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._run_pending_render(future)
+        else:
+            loop.call_soon(self._run_pending_render, future)
+        return future
+
+    def render_sync(self):
+        """Run a render scheduled by render_async() now instead of on the loop"""
+        pending = self._pending_render
+        if pending is not None and not pending.done():
+            self._run_pending_render(pending)
+
+    def _run_pending_render(self, future: concurrent.futures.Future):
+        """Resolve a render_async() future by rendering once"""
+        if future.done():
+            return
+        if self._pending_render is future:
+            self._pending_render = None
+        try:
+            self.render(if_visible=self._pending_if_visible)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    def render_sequence(self, frames) -> Optional[np.ndarray]:
+        """Render several frames (e.g. an animated turntable) into an (N, H, W, 4) array"""
+        return render_sequence(frames)
+
     def set_resolution(self, width: int, height: int):
         """Set render resolution"""
+        scene = get_scene()
+        if (width, height) == (self.width, self.height) == (scene.render.resolution_x, scene.render.resolution_y):
+            # Nothing changed - skip the re-render
+            return
+        
         self.width = width
         self.height = height
         
         # Update Blender render settings
-        scene = get_scene()
         scene.render.resolution_x = width
         scene.render.resolution_y = height
         
@@ -629,50 +881,69 @@ class BpyWidget(anywidget.AnyWidget):
 
     # ========== Extension Management ==========
     
+    def _cached_extension_query(self, key: tuple, query: typing.Callable, *args) -> typing.List[typing.Dict]:
+        """Return a recent result of an extension listing query (see EXTENSION_CACHE_TTL)
+        
+        Callers get a deep copy - editing a returned dict must not change the cache.
+        """
+        now = time.monotonic()
+        cached = self._extension_cache.get(key)
+        if cached is None or now - cached[0] >= EXTENSION_CACHE_TTL:
+            cached = (now, query(*args))
+            self._extension_cache[key] = cached
+        return copy.deepcopy(cached[1])
+    
     def list_repositories(self) -> typing.List[typing.Dict]:
         """List all extension repositories"""
-        return extension_manager.list_repositories()
+        return self._cached_extension_query(
+            ('repositories',), extension_manager.list_repositories
+        )
     
     def list_extensions(self, repo_name: typing.Optional[str] = None) -> typing.List[typing.Dict]:
         """List extensions from repositories"""
-        return extension_manager.list_extensions(repo_name)
+        return self._cached_extension_query(
+            ('extensions', repo_name), extension_manager.list_extensions, repo_name
+        )
     
+    def _find_extension(self, pkg_id: str) -> typing.Tuple[typing.Optional[typing.Dict], typing.Optional[str]]:
+        """Return (extension, repository module) for pkg_id, or (None, None)"""
+        repo_modules = {repo['name']: repo['module'] for repo in self.list_repositories()}
+        for ext in self.list_extensions():
+            if ext['id'] == pkg_id:
+                repo_module = repo_modules.get(ext.get('repository'))
+                if repo_module is not None:
+                    return ext, repo_module
+        return None, None
+    
+    @_invalidates_extension_cache
     def enable_extension(self, pkg_id: str, repo_module: typing.Optional[str] = None) -> bool:
         """Enable an extension"""
         if repo_module:
             return extension_manager.enable_extension(repo_module, pkg_id)
         
-        # Find extension in repositories
-        for ext in self.list_extensions():
-            if ext['id'] == pkg_id:
-                repos = self.list_repositories()
-                for repo in repos:
-                    if repo['name'] == ext.get('repository'):
-                        if extension_manager.enable_extension(repo['module'], pkg_id):
-                            self.status = f"Enabled: {ext.get('name', pkg_id)}"
-                            return True
+        ext, repo_module = self._find_extension(pkg_id)
+        if ext is not None and extension_manager.enable_extension(repo_module, pkg_id):
+            self.status = f"Enabled: {ext.get('name', pkg_id)}"
+            return True
         
         self.status = f"Extension not found: {pkg_id}"
         return False
     
+    @_invalidates_extension_cache
     def disable_extension(self, pkg_id: str, repo_module: typing.Optional[str] = None) -> bool:
         """Disable an extension"""
         if repo_module:
             return extension_manager.disable_extension(repo_module, pkg_id)
         
-        # Find extension in repositories
-        for ext in self.list_extensions():
-            if ext['id'] == pkg_id:
-                repos = self.list_repositories()
-                for repo in repos:
-                    if repo['name'] == ext.get('repository'):
-                        if extension_manager.disable_extension(repo['module'], pkg_id):
-                            self.status = f"Disabled: {ext.get('name', pkg_id)}"
-                            return True
+        ext, repo_module = self._find_extension(pkg_id)
+        if ext is not None and extension_manager.disable_extension(repo_module, pkg_id):
+            self.status = f"Disabled: {ext.get('name', pkg_id)}"
+            return True
         
         self.status = f"Extension not found: {pkg_id}"
         return False
     
+    @_invalidates_extension_cache
     def sync_repositories(self):
         """Sync all repositories"""
         if not bpy.app.online_access:
@@ -687,6 +958,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Sync failed: {str(e)}"
             return False
     
+    @_invalidates_extension_cache
     def install_extension_from_file(
         self, 
         filepath: typing.Union[str, Path], 
@@ -701,11 +973,10 @@ class BpyWidget(anywidget.AnyWidget):
         
         # Use first user repository if not specified
         if not repo_module:
-            user_repos = [r for r in repos if r['source'] == 'USER']
-            if not user_repos:
+            repo_module = next((r['module'] for r in repos if r['source'] == 'USER'), None)
+            if repo_module is None:
                 self.status = "No user repository available"
                 return False
-            repo_module = user_repos[0]['module']
         
         try:
             extension_manager.install_from_file(str(filepath), repo_module, enable_on_install)
@@ -715,6 +986,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Install failed: {str(e)}"
             return False
     
+    @_invalidates_extension_cache
     def install_extension(
         self,
         source: str,
@@ -755,6 +1027,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Install failed: {str(e)}"
             return False
     
+    @_invalidates_extension_cache
     def upgrade_extensions(self, active_only: bool = False) -> bool:
         """Upgrade extensions to latest versions"""
         try:
@@ -854,6 +1127,7 @@ class BpyWidget(anywidget.AnyWidget):
         
         return result
     
+    @_invalidates_extension_cache
     def uninstall_extension(self, pkg_id: str, repo_index: int = -1) -> bool:
         """Uninstall an extension
         
@@ -877,6 +1151,7 @@ class BpyWidget(anywidget.AnyWidget):
         """List legacy addons (pre-4.2 style)"""
         return extension_manager.list_legacy_addons()
     
+    @_invalidates_extension_cache
     def enable_legacy_addon(self, module_name: str) -> bool:
         """Enable a legacy addon"""
         try:
@@ -887,6 +1162,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Failed: {str(e)}"
             return False
     
+    @_invalidates_extension_cache
     def disable_legacy_addon(self, module_name: str) -> bool:
         """Disable a legacy addon"""
         try:
@@ -903,16 +1179,31 @@ class BpyWidget(anywidget.AnyWidget):
         """Clear all objects from the scene"""
         clear_scene()
         self.status = "Scene cleared"
+    
+    def rebuild_default_scene(self):
+        """Clear the scene and recreate the default lighting, background and test objects"""
+        clear_scene()
+        setup_lighting()
+        setup_world_background()
+        create_suzanne()
+        create_test_cube()
+        # Single depsgraph update for the whole batch, deferred to the next render
+        self._update_view()
+        self.status = "Default scene rebuilt"
         
     def setup_camera(self, distance=8.0, target=(0, 0, 0)):
         """Setup or reset camera"""
         camera = setup_camera(distance=distance, target=target)
         # Update widget camera parameters
         distance, angle_x, angle_z = calculate_spherical_from_position(camera.location)
-        with self.hold_sync():
+        with self._self_update():
             self.camera_distance = distance
             self.camera_angle_x = angle_x
             self.camera_angle_z = angle_z
+        if self.is_initialized:
+            # One render for the reset instead of one per echoed trait
+            self._update_needed = True
+            self._schedule_update()
         self.status = "Camera reset"
         return camera
         
@@ -942,6 +1233,14 @@ class BpyWidget(anywidget.AnyWidget):
         """Create material with PBR parameters"""
         return create_material(name, **kwargs)
         
+    def create_material_cached(self, name: str, **kwargs):
+        """Create material or reuse one built with identical parameters"""
+        return create_material_cached(name, **kwargs)
+    
+    def clear_material_cache(self):
+        """Release cached materials so unused ones are purged and not saved"""
+        clear_material_cache()
+    
     def create_preset_material(self, name: str, preset: str):
         """Create material from preset (gold, glass, etc.)"""
         return create_preset_material(name, preset)
@@ -949,6 +1248,10 @@ class BpyWidget(anywidget.AnyWidget):
     def assign_material(self, obj, material):
         """Assign material to object"""
         assign_material(obj, material)
+    
+    def assign_material_batch(self, objects, material):
+        """Assign material to many objects (shared meshes are touched once)"""
+        return assign_material_batch(objects, material)
         
     # ========== Compositor Methods ==========
     
@@ -1040,7 +1343,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Exported to {Path(file_path).name}"
         except Exception as e:
             self.status = f"GLTF export failed: {str(e)}"
-            print(f"GLTF export error: {e}")
+            logger.error(f"GLTF export error: {e}")
     
     def import_usd(self, file_path: typing.Union[str, Path], **kwargs):
         """Import USD/USDZ file"""
@@ -1055,7 +1358,7 @@ class BpyWidget(anywidget.AnyWidget):
             return objects
         except Exception as e:
             self.status = f"USD import failed: {str(e)}"
-            print(f"USD import error: {e}")
+            logger.error(f"USD import error: {e}")
             return []
     
     def export_usd(self, file_path: typing.Union[str, Path], selected_only=False, **kwargs):
@@ -1065,7 +1368,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Exported to {Path(file_path).name}"
         except Exception as e:
             self.status = f"USD export failed: {str(e)}"
-            print(f"USD export error: {e}")
+            logger.error(f"USD export error: {e}")
     
     def import_alembic(self, file_path: typing.Union[str, Path], **kwargs):
         """Import Alembic (.abc) file"""
@@ -1080,7 +1383,7 @@ class BpyWidget(anywidget.AnyWidget):
             return objects
         except Exception as e:
             self.status = f"Alembic import failed: {str(e)}"
-            print(f"Alembic import error: {e}")
+            logger.error(f"Alembic import error: {e}")
             return []
     
     def export_alembic(self, file_path: typing.Union[str, Path], selected_only=False, **kwargs):
@@ -1090,7 +1393,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Exported to {Path(file_path).name}"
         except Exception as e:
             self.status = f"Alembic export failed: {str(e)}"
-            print(f"Alembic export error: {e}")
+            logger.error(f"Alembic export error: {e}")
     
     def export_scene_as_parquet(self, file_path: typing.Union[str, Path], include_metadata=True):
         """Export entire scene data as Parquet file"""
@@ -1099,7 +1402,7 @@ class BpyWidget(anywidget.AnyWidget):
             self.status = f"Scene exported to {Path(file_path).name}"
         except Exception as e:
             self.status = f"Parquet export failed: {str(e)}"
-            print(f"Parquet export error: {e}")
+            logger.error(f"Parquet export error: {e}")
     
     def import_scene_from_parquet(self, file_path: typing.Union[str, Path]):
         """Import scene data from Parquet file"""
@@ -1114,7 +1417,7 @@ class BpyWidget(anywidget.AnyWidget):
             return objects
         except Exception as e:
             self.status = f"Parquet import failed: {str(e)}"
-            print(f"Parquet import error: {e}")
+            logger.error(f"Parquet import error: {e}")
             return []
     
     # ========== Blender File Methods ==========
@@ -1196,6 +1499,14 @@ class BpyWidget(anywidget.AnyWidget):
         file_path = Path(file_path)
         
         try:
+            # Data import pulls in polars - load it on first use, not with the widget
+            from .core.data_import import (
+                import_data_as_points,
+                import_dataframe_as_curve,
+                import_multiple_series,
+                read_data_file,
+            )
+            
             if as_type == "points":
                 collection = import_data_as_points(file_path, **kwargs)
                 self.status = f"Imported {file_path.name} as point cloud"
@@ -1220,13 +1531,12 @@ class BpyWidget(anywidget.AnyWidget):
                 raise ValueError(f"Unknown as_type: {as_type}. Use 'points', 'curve', or 'series'")
             
             # Update view and render
-            bpy.context.view_layer.update()
+            self._update_view()
             self._update_camera_and_render()
             
         except Exception as e:
             self.status = f"Import failed: {str(e)}"
-            print(f"Import error: {e}")
-            traceback.print_exc()
+            logger.exception(f"Import error: {e}")
 
     def batch_import(
         self,
@@ -1238,77 +1548,87 @@ class BpyWidget(anywidget.AnyWidget):
             self.initialize()
         
         try:
+            from .core.data_import import batch_import_data
+            
             collections = batch_import_data(file_patterns, **kwargs)
             self.status = f"Batch imported {len(collections)} files"
             
             # Update view and render
-            bpy.context.view_layer.update()
+            self._update_view()
             self._update_camera_and_render()
             
         except Exception as e:
             self.status = f"Batch import failed: {str(e)}"
-            print(f"Batch import error: {e}")
-            traceback.print_exc()
+            logger.exception(f"Batch import error: {e}")
 
     def import_data_with_metadata(self, file_path: typing.Union[str, Path], **kwargs):
         """Import data with metadata stored as custom properties"""
+        from .core.data_import import import_data_with_metadata
+        
         return import_data_with_metadata(file_path, **kwargs)
 
     # ========== Utility Methods ==========
 
     def _update_view(self):
-        """Update view layer and dependency graph"""
-        bpy.context.view_layer.update()
-        bpy.context.evaluated_depsgraph_get()
+        """Mark the scene as edited; the view layer is updated once before the next render"""
+        self._depsgraph_dirty = True
 
     # ========== Convenience Properties ==========
 
     @property
     def context(self):
         """Access to bpy.context."""
-        self._ensure_bpy_loaded()
+        if bpy is None:  # Only the first access pays for the loader call
+            self._ensure_bpy_loaded()
         return bpy.context
 
     @property
     def scene(self):
         """Access to bpy.context.scene."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return bpy.context.scene
 
     @property
     def active_object(self):
         """Access to bpy.context.active_object."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return getattr(bpy.context, 'active_object', None)
 
     @property
     def selected_objects(self):
         """Access to bpy.context.selected_objects."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return getattr(bpy.context, 'selected_objects', [])
 
     @property
     def data(self):
         """Access to bpy.data."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return bpy.data
 
     @property
     def ops(self):
         """Access to bpy.ops."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return bpy.ops
 
     @property
     def objects(self):
         """Access to bpy.data.objects."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return bpy.data.objects
 
     @property
     def camera(self):
         """Access to bpy.context.scene.camera."""
-        self._ensure_bpy_loaded()
+        if bpy is None:
+            self._ensure_bpy_loaded()
         return bpy.context.scene.camera
 
     def _debug_info(self):
@@ -1320,12 +1640,14 @@ class BpyWidget(anywidget.AnyWidget):
         print(f"Camera: distance={self.camera_distance}, angles=({self.camera_angle_x}, {self.camera_angle_z})")
         
         scene = get_scene()
-        if scene.camera:
-            print(f"\nCamera location: {scene.camera.location}")
-            print(f"Camera rotation: {scene.camera.rotation_euler}")
-        print(f"Scene objects: {[obj.name for obj in bpy.data.objects]}")
-        print(f"Render engine: {scene.render.engine}")
-        print(f"Resolution: {scene.render.resolution_x}x{scene.render.resolution_y}")
+        camera = scene.camera
+        render = scene.render
+        if camera:
+            print(f"\nCamera location: {camera.location}")
+            print(f"Camera rotation: {camera.rotation_quaternion}")
+        print(f"Scene objects: {bpy.data.objects.keys()}")
+        print(f"Render engine: {render.engine}")
+        print(f"Resolution: {render.resolution_x}x{render.resolution_y}")
         print("==================\n")
 
     def __repr__(self):
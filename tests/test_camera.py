@@ -0,0 +1,62 @@
+"""Tests for camera module"""
+import math
+
+import bpy
+import numpy as np
+
+from bpy_widget.core.camera import (
+    _camera_pose,
+    calculate_spherical_from_position,
+    spherical_to_cartesian,
+    spherical_to_cartesian_batch,
+    update_camera_spherical_batch,
+)
+
+
+def test_spherical_to_cartesian_round_trip():
+    """Test that spherical coordinates survive a cartesian round trip"""
+    target = (1.0, -2.0, 0.5)
+    location = spherical_to_cartesian(8.0, 0.8, -0.785, target)
+
+    distance, angle_x, angle_z = calculate_spherical_from_position(location, target)
+
+    assert math.isclose(distance, 8.0)
+    assert math.isclose(angle_x, 0.8)
+    assert math.isclose(angle_z, -0.785)
+
+
+def test_spherical_to_cartesian_batch_matches_scalar():
+    """Test that the batched conversion matches the scalar one row by row"""
+    distance = np.linspace(2.0, 10.0, 5)
+    angle_x = np.linspace(-1.0, 1.0, 5)
+    angle_z = np.linspace(0.0, 2 * math.pi, 5)
+    target = (0.0, 0.0, 1.0)
+
+    positions = spherical_to_cartesian_batch(distance, angle_x, angle_z, target)
+
+    assert positions.shape == (5, 3)
+    for row, d, ax, az in zip(positions, distance, angle_x, angle_z):
+        np.testing.assert_allclose(row, spherical_to_cartesian(d, ax, az, target))
+
+
+def test_spherical_to_cartesian_batch_broadcasts_scalar_distance():
+    """Test that a scalar distance is broadcast along an angle sweep"""
+    positions = spherical_to_cartesian_batch(5.0, 0.0, np.linspace(0.0, math.pi, 3))
+
+    assert positions.shape == (3, 3)
+    np.testing.assert_allclose(np.linalg.norm(positions - (0, 0, 1), axis=1), 5.0)
+
+
+def test_update_camera_spherical_batch_bakes_keyframes(clean_scene):
+    """Test that baked keyframes match the per-frame spherical pose"""
+    angle_z = np.linspace(0.0, 2 * math.pi, 12)
+
+    assert update_camera_spherical_batch(10.0, 0.3, angle_z, frame_start=1)
+
+    camera = bpy.context.scene.camera
+    for frame in (1, 6, 12):
+        bpy.context.scene.frame_set(frame)
+        location, rotation = _camera_pose(10.0, 0.3, float(angle_z[frame - 1]), (0, 0, 1))
+        np.testing.assert_allclose(camera.location, location, atol=1e-4)
+        # q and -q are the same rotation
+        assert abs(np.dot(camera.rotation_quaternion, rotation)) > 1 - 1e-5
@@ -3,7 +3,11 @@ import pytest
 from pathlib import Path
 import tempfile
 
-from bpy_widget.core.io_handlers import _validate_output_path
+from bpy_widget.core.io_handlers import (
+    _transform_sidecar_path,
+    _validate_output_path,
+    export_scene_as_parquet,
+)
 
 
 def test_validate_output_path_valid():
@@ -21,6 +25,17 @@ def test_validate_output_path_nonexistent_directory():
         _validate_output_path(invalid_path)
 
 
+def test_validate_output_path_deleted_directory(tmp_path):
+    """Test validation fails once a previously seen directory is removed"""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    _validate_output_path(out_dir / "first.glb")
+
+    out_dir.rmdir()
+    with pytest.raises(ValueError, match="Directory does not exist"):
+        _validate_output_path(out_dir / "second.glb")
+
+
 def test_validate_output_path_readonly_file():
     """Test validation fails for read-only file"""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -34,3 +49,16 @@ def test_validate_output_path_readonly_file():
         finally:
             # Clean up - restore write permissions
             test_file.chmod(0o644)
+
+
+def test_export_scene_as_parquet_removes_stale_sidecar(test_cube, tmp_path):
+    """Test exporting without metadata drops the transform sidecar of an earlier export"""
+    parquet_path = tmp_path / "scene.parquet"
+    sidecar_path = _transform_sidecar_path(parquet_path)
+
+    export_scene_as_parquet(parquet_path)
+    assert sidecar_path.exists()
+
+    export_scene_as_parquet(parquet_path, include_metadata=False)
+    assert parquet_path.exists()
+    assert not sidecar_path.exists()
@@ -2,7 +2,16 @@
 import pytest
 import bpy
 
-from bpy_widget.core.materials import create_material, create_preset_material, assign_material
+from bpy_widget.core.materials import (
+    assign_material,
+    assign_material_batch,
+    clear_material_cache,
+    create_material,
+    create_material_cached,
+    create_preset_material,
+)
+from bpy_widget.core.geometry import create_test_cube
+from bpy_widget.core.scene import clear_scene
 
 
 def test_create_material_basic(clean_scene):
@@ -57,6 +66,20 @@ def test_assign_material(test_cube):
     assert test_cube.data.materials[0] == mat
 
 
+def test_assign_material_batch_shared_mesh(test_cube):
+    """Test that objects sharing a mesh are assigned once"""
+    twin = bpy.data.objects.new("CubeTwin", test_cube.data)
+    bpy.context.collection.objects.link(twin)
+    empty = bpy.data.objects.new("Empty", None)
+    mat = create_material("BatchMat")
+
+    visited = assign_material_batch([test_cube, twin, empty], mat)
+
+    assert visited == 1
+    assert len(test_cube.data.materials) == 1
+    assert twin.data.materials[0] == mat
+
+
 def test_material_with_emission(clean_scene):
     """Test material with emission"""
     mat = create_material(
@@ -68,3 +91,47 @@ def test_material_with_emission(clean_scene):
     nodes = mat.node_tree.nodes
     principled = nodes.get("Principled BSDF")
     assert principled.inputs["Emission Strength"].default_value == 2.0
+
+
+def test_create_material_cached_reuses_identical(clean_scene):
+    """Test that identical parameters reuse one material until it is removed"""
+    mat = create_material_cached("Red", base_color=(1.0, 0.0, 0.0))
+
+    assert create_material_cached("Red2", base_color=(1.0, 0.0, 0.0)) == mat
+    assert create_material_cached("Blue", base_color=(0.0, 0.0, 1.0)) != mat
+
+    bpy.data.materials.remove(mat)
+    rebuilt = create_material_cached("Red", base_color=(1.0, 0.0, 0.0))
+    assert rebuilt.name in bpy.data.materials
+
+
+def test_create_material_cached_recovers_stamped_material(clean_scene):
+    """Test that a stamped material is found again after the in-memory cache is lost"""
+    from bpy_widget.core import materials
+
+    mat = create_material_cached("Green", base_color=(0, 1, 0))
+    materials._clear_material_cache()  # As on load_pre
+
+    assert create_material_cached("Green2", base_color=(0.0, 1.0, 0.0)) == mat
+
+
+def test_create_material_cached_survives_clear_scene(clean_scene):
+    """Test that cached materials are kept when the objects using them are cleared"""
+    cube = create_test_cube(material_color=(0.2, 0.4, 0.6, 1.0))
+    mat = cube.data.materials[0]
+
+    clear_scene()
+
+    assert mat.name in bpy.data.materials
+    assert create_test_cube(material_color=(0.2, 0.4, 0.6, 1.0)).data.materials[0] == mat
+
+
+def test_clear_material_cache_releases_materials(clean_scene):
+    """Test that released cached materials are purged with the objects using them"""
+    cube = create_test_cube(material_color=(0.6, 0.4, 0.2, 1.0))
+    mat_name = cube.data.materials[0].name
+
+    clear_material_cache()
+    clear_scene()
+
+    assert mat_name not in bpy.data.materials
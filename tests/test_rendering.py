@@ -7,7 +7,14 @@ import bpy
 import numpy as np
 import pytest
 
-from bpy_widget.core.rendering import render_to_pixels, setup_rendering
+from bpy_widget.core.rendering import (
+    RENDER_TEMP_DIR,
+    _read_targa_rgba,
+    _to_display_pixels,
+    render_sequence,
+    render_to_pixels,
+    setup_rendering,
+)
 
 # Use Cycles CPU in CI environments (EEVEE requires GPU)
 CI_ENGINE = 'CYCLES' if os.getenv('CI') else 'BLENDER_EEVEE_NEXT'
@@ -34,7 +41,38 @@ def test_setup_rendering_cycles(clean_scene):
     assert scene.render.engine == 'CYCLES'
     assert scene.render.resolution_x == 1920
     assert scene.render.resolution_y == 1080
-    assert scene.cycles.samples == 64
+    assert scene.cycles.samples == 32
+    assert scene.cycles.use_adaptive_sampling
+    assert scene.cycles.use_denoising
+    assert scene.cycles.device in ('CPU', 'GPU')
+
+
+def test_setup_rendering_custom_samples(clean_scene):
+    """Test that samples overrides the per-engine defaults"""
+    setup_rendering(width=256, height=256, engine='BLENDER_EEVEE_NEXT', samples=4)
+    assert bpy.context.scene.eevee.taa_render_samples == 4
+
+    setup_rendering(width=256, height=256, engine='CYCLES', samples=8)
+    assert bpy.context.scene.cycles.samples == 8
+
+
+def test_setup_rendering_cycles_cpu_only(clean_scene):
+    """Test that use_gpu=False keeps Cycles on the CPU"""
+    setup_rendering(width=256, height=256, engine='CYCLES', use_gpu=False)
+
+    assert bpy.context.scene.cycles.device == 'CPU'
+
+
+def test_setup_rendering_gpu_cache_cleared_on_load(clean_scene):
+    """Test that a file load or factory reset forgets the configured scene"""
+    from bpy_widget.core import rendering
+
+    setup_rendering(width=256, height=256, engine='CYCLES')
+    assert rendering._gpu_configured_for is not None
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    assert rendering._gpu_configured_for is None
 
 
 def test_render_to_pixels_with_camera(test_camera, test_cube):
@@ -56,6 +94,119 @@ def test_render_to_pixels_with_camera(test_camera, test_cube):
     assert pixels.dtype == np.uint8
 
 
+def test_render_to_pixels_flip_y(test_camera, test_cube):
+    """Test that flip_y=False returns the same image bottom-up and contiguous"""
+    setup_rendering(width=64, height=48, engine=CI_ENGINE, samples=1)
+    if CI_ENGINE == 'CYCLES':
+        bpy.context.scene.cycles.device = 'CPU'
+
+    top_down, _, _ = render_to_pixels()
+    bottom_up, _, _ = render_to_pixels(flip_y=False)
+
+    assert bottom_up.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(bottom_up[::-1], top_down)
+
+
+def test_render_to_pixels_out_buffer(test_camera, test_cube):
+    """Test that a matching out array is filled in place and a mismatched one is ignored"""
+    setup_rendering(width=64, height=48, engine=CI_ENGINE, samples=1)
+    if CI_ENGINE == 'CYCLES':
+        bpy.context.scene.cycles.device = 'CPU'
+
+    out = np.zeros((48, 64, 4), dtype=np.uint8)
+    pixels, _, _ = render_to_pixels(out=out)
+    assert pixels is out
+    assert out.any()
+
+    wrong_size = np.zeros((10, 10, 4), dtype=np.uint8)
+    pixels, _, _ = render_to_pixels(out=wrong_size)
+    assert pixels is not wrong_size
+    assert pixels.shape == (48, 64, 4)
+
+
+def test_render_to_pixels_float_dtype(test_camera, test_cube):
+    """Test that float dtypes return linear render values"""
+    setup_rendering(width=64, height=48, engine=CI_ENGINE, samples=1)
+    if CI_ENGINE == 'CYCLES':
+        bpy.context.scene.cycles.device = 'CPU'
+
+    pixels, width, height = render_to_pixels(dtype='float16')
+
+    assert pixels.dtype == np.float16
+    assert pixels.shape == (height, width, 4)
+    assert (width, height) == (64, 48)
+    assert float(pixels.max()) > 0.0
+
+    with pytest.raises(ValueError):
+        render_to_pixels(dtype='int32')
+
+
+def test_render_sequence_stacks_frames(test_camera, test_cube):
+    """Test rendering several frames into one array"""
+    setup_rendering(width=64, height=48, engine=CI_ENGINE, samples=1)
+    scene = bpy.context.scene
+    if CI_ENGINE == 'CYCLES':
+        scene.cycles.device = 'CPU'
+    scene.frame_set(5)
+    scene.render.use_persistent_data = False
+
+    frames = render_sequence([1, 2])
+
+    assert frames is not None
+    assert frames.shape == (2, 48, 64, 4)
+    assert frames.dtype == np.uint8
+    assert scene.frame_current == 5
+    assert scene.render.use_persistent_data is False
+
+
+def test_render_sequence_rejects_resolution_change(test_camera, test_cube):
+    """Test that a frame rendered at another resolution raises a clear error"""
+    setup_rendering(width=64, height=48, engine=CI_ENGINE, samples=1)
+    scene = bpy.context.scene
+    if CI_ENGINE == 'CYCLES':
+        scene.cycles.device = 'CPU'
+
+    def resize(scene, *_args):
+        if scene.frame_current == 2:
+            scene.render.resolution_x = 32
+
+    bpy.app.handlers.frame_change_pre.append(resize)
+    try:
+        with pytest.raises(ValueError, match="expected 64x48"):
+            render_sequence([1, 2])
+    finally:
+        bpy.app.handlers.frame_change_pre.remove(resize)
+
+
+def test_read_targa_rgba(tmp_path):
+    """Test direct uint8 readout of an uncompressed 32-bit Targa file"""
+    # 2x1 image, bottom-up rows, BGRA pixels: red, then green with half alpha
+    header = bytes([0, 0, 2]) + bytes(9) + (2).to_bytes(2, 'little') + (1).to_bytes(2, 'little') + bytes([32, 8])
+    tga_path = tmp_path / "pixels.tga"
+    tga_path.write_bytes(header + bytes([0, 0, 255, 255, 0, 255, 0, 128]))
+
+    pixels = _read_targa_rgba(str(tga_path))
+    assert pixels.shape == (1, 2, 4)
+    assert pixels[0, 0].tolist() == [255, 0, 0, 255]
+    assert pixels[0, 1].tolist() == [0, 255, 0, 128]
+
+    # Compressed (RLE) Targa is not handled here
+    tga_path.write_bytes(bytes([0, 0, 10]) + header[3:] + bytes(8))
+    assert _read_targa_rgba(str(tga_path)) is None
+
+
+def test_to_display_pixels_rounds_and_flips():
+    """Test float to uint8 conversion rounds, clamps and flips rows"""
+    # Two bottom-up rows of one pixel each
+    pixels_float = np.array([[[0.5, 1.2, -0.1, 1.0]], [[0.0, 0.998, 0.002, 1.0]]], dtype=np.float32)
+
+    pixels = _to_display_pixels(pixels_float)
+    assert pixels.dtype == np.uint8
+    assert pixels.flags['C_CONTIGUOUS']
+    assert pixels[0, 0].tolist() == [0, 254, 1, 255]
+    assert pixels[1, 0].tolist() == [128, 255, 0, 255]
+
+
 def test_render_to_pixels_no_camera(clean_scene):
     """Test rendering without camera returns None"""
     pixels, width, height = render_to_pixels()
@@ -75,14 +226,14 @@ def test_temporary_file_cleanup(test_camera, test_cube):
         scene.cycles.device = 'CPU'
 
     # Get temp directory before render
-    temp_dir = Path(tempfile.gettempdir())
-    temp_files_before = set(temp_dir.glob("*.png"))
+    temp_dir = Path(RENDER_TEMP_DIR or tempfile.gettempdir())
+    temp_files_before = set(temp_dir.glob("*.png")) | set(temp_dir.glob("*.tga"))
 
     # Render
     pixels, _, _ = render_to_pixels()
 
     # Check temp files after render
-    temp_files_after = set(temp_dir.glob("*.png"))
+    temp_files_after = set(temp_dir.glob("*.png")) | set(temp_dir.glob("*.tga"))
 
     # Should not have created persistent temp files
     new_files = temp_files_after - temp_files_before